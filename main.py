@@ -6,8 +6,12 @@ Autor: Diego Patzan, Roberto Najera, Luiz Gonzalez
 Fecha: Noviembre 2025
 """
 
+import os
 import sys
+from src.metrics import SnapshotWriter
 from src.turing_machine import TuringMachine
+from src.pipeline import MachinePipeline, PipelineStage
+from src.validation import InputValidationError, validator_for
 #from src.caesar_encrypt import create_encrypt_machine
 #from src.caesar_decrypt import create_decrypt_machine
 
@@ -48,6 +52,17 @@ def encrypt_message():
     
     machine = TuringMachine()
     machine.load_config("config/encrypt_config.json")
+    
+    # Rechazar entradas imposibles antes de simular la máquina
+    try:
+        validator_for(machine.program).validate(input_string.strip().upper())
+    except InputValidationError as e:
+        print(f"ERROR: Entrada inválida en la {e}")
+        print(f"  {input_string.strip().upper()}")
+        print(f"  {' ' * e.position}^")
+        print()
+        return
+    
     accepted, encrypted = machine.run(input_string.strip().upper(), verbose=True)
     if not accepted:
         print(f"ERROR: La cadena no fue aceptada por la máquina. Revisa quel formato sea llave#mensaje y que la llave este en el rango correcto: {encrypted}")
@@ -73,6 +88,17 @@ def decrypt_message():
     
     machine = TuringMachine()
     machine.load_config("config/decrypt_config.json")
+    
+    # Rechazar entradas imposibles antes de simular la máquina
+    try:
+        validator_for(machine.program).validate(input_string.strip().upper())
+    except InputValidationError as e:
+        print(f"ERROR: Entrada inválida en la {e}")
+        print(f"  {input_string.strip().upper()}")
+        print(f"  {' ' * e.position}^")
+        print()
+        return
+    
     accepted, decrypted = machine.run(input_string.strip().upper(), verbose=True)
     if not accepted:
         print(f"ERROR: La cadena no fue aceptada por la máquina. Revisa quel formato sea llave#mensaje y que la llave este en el rango correcto: {decrypted}")
@@ -142,11 +168,6 @@ def run_additional_tests():
     print("  PRUEBAS ADICIONALES")
     print("=" * 70)
     
-    encrypt_machine = TuringMachine()
-    encrypt_machine.load_config("config/encrypt_config.json")
-    decrypt_machine = TuringMachine()
-    decrypt_machine.load_config("config/decrypt_config.json")
-    
     test_cases = [
         ("1#HOLA MUNDO", "Mensaje simple con desplazamiento 1"),
         ("5#TEORIA DE LA COMPUTACION", "Frase académica"),
@@ -158,15 +179,17 @@ def run_additional_tests():
         print(f"\n--- PRUEBA {i}: {description} ---")
         print(f"Entrada original: {test_input}")
         
-        # Encriptar
-        _, encrypted = encrypt_machine.run(test_input, verbose=True)
-        print(f"Encriptado: {test_input.split('#')[0]}#{encrypted}")
-        
-        # Decriptar para verificar
+        # Encriptar y decriptar en una tubería: la cinta de la primera
+        # máquina pasa directamente a la segunda con el prefijo de la llave
         key = test_input.split('#')[0]
-        to_decrypt = f"{key}#{encrypted}"
-        _, decrypted = decrypt_machine.run(to_decrypt, verbose=True)
-        
+        pipeline = MachinePipeline([
+            PipelineStage("config/encrypt_config.json"),
+            PipelineStage("config/decrypt_config.json", prefix=f"{key}#"),
+        ])
+        _, decrypted = pipeline.run(test_input, trace=True, verbose=True)
+        encrypted = pipeline.stage_outputs[0]
+        print(f"Encriptado: {key}#{encrypted}")
+        print(f"Pasos: {' → '.join(str(result['steps']) for result in pipeline.results)}")
         print(f"Decriptado: {decrypted}")
         
         # Verificar que la decriptación recupera el mensaje original
@@ -183,6 +206,10 @@ def main():
     """Función principal del programa."""
     print_banner()
     
+    # Instantáneas JSON de las métricas si se define TM_METRICS_FILE
+    metrics_file = os.environ.get('TM_METRICS_FILE')
+    writer = SnapshotWriter(metrics_file).start() if metrics_file else None
+    
     while True:
         print_menu()
         
@@ -210,6 +237,9 @@ def main():
         except Exception as e:
             print(f"\n✗ Error: {e}")
             print("Por favor intente de nuevo.")
+    
+    if writer is not None:
+        writer.stop()
 
 
 if __name__ == "__main__":
@@ -7,11 +7,54 @@ Estrategia:
 2. Procesar cada carácter del mensaje cifrado
 3. Aplicar el desplazamiento inverso usando operaciones de MT
 4. Escribir el resultado decifrado
+
+Criptoanálisis (llave perdida):
+Se cuentan las frecuencias de letras una sola vez y el puntaje chi-cuadrado
+de cada llave se obtiene rotando ese histograma, por lo que probar todas las
+llaves cuesta O(n + 26²) en lugar de 26 decriptaciones completas.
 """
 
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from src import metrics
+from src.config_generator import build_program
 from src.turing_machine import TuringMachine
 
 
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Frecuencia relativa (%) de las letras en español (la Ñ se cuenta como N)
+SPANISH_FREQUENCIES = {
+    'A': 12.53, 'B': 1.42, 'C': 4.68, 'D': 5.86, 'E': 13.68, 'F': 0.69,
+    'G': 1.01, 'H': 0.70, 'I': 6.25, 'J': 0.44, 'K': 0.02, 'L': 4.97,
+    'M': 3.15, 'N': 7.02, 'O': 8.68, 'P': 2.51, 'Q': 0.88, 'R': 6.87,
+    'S': 7.98, 'T': 4.63, 'U': 3.93, 'V': 0.90, 'W': 0.01, 'X': 0.22,
+    'Y': 0.90, 'Z': 0.52,
+}
+
+# A partir de este tamaño el conteo de letras se reparte entre procesos
+PARALLEL_THRESHOLD = 4 * 1024 * 1024
+
+# Palabras del texto que se usan para contar aciertos de diccionario
+DICTIONARY_SAMPLE_WORDS = 200
+
+
+def letter_histogram(text):
+    """
+    Cuenta cuántas veces aparece cada letra A-Z en el texto.
+
+    Args:
+        text: Texto en mayúsculas
+
+    Returns:
+        Lista de 26 conteos (posición 0 = A)
+    """
+    counts = Counter(text)
+    return [counts.get(letter, 0) for letter in LETTERS]
+
+
 class CaesarDecryptMachine(TuringMachine):
     """
     Máquina de Turing para decriptar mensajes con cifrado César.
@@ -51,6 +94,7 @@ class CaesarDecryptMachine(TuringMachine):
         # Las transiciones se generarán dinámicamente
         self.transitions = {}
     
+    @metrics.timed('caesar_helper_seconds', operation='decrypt')
     def decrypt(self, input_string, verbose=False):
         """
         Decripta un mensaje usando cifrado César.
@@ -146,6 +190,99 @@ class CaesarDecryptMachine(TuringMachine):
         # Convertir de vuelta a letra
         return chr(new_pos + ord('A'))
     
+    @metrics.timed('caesar_helper_seconds', operation='brute_force')
+    def brute_force(self, ciphertext, top_k=5, dictionary=None,
+                    frequencies=None, workers=None):
+        """
+        Decripta un mensaje sin conocer la llave probando las 26 llaves.
+        
+        Las candidatas se ordenan por el estadístico chi-cuadrado entre las
+        frecuencias observadas y las esperadas (menor es mejor). Si se da un
+        diccionario, primero se ordenan por aciertos de palabras.
+        
+        Args:
+            ciphertext: Mensaje cifrado (sin la parte "llave#")
+            top_k: Número de candidatas a devolver
+            dictionary: Conjunto opcional de palabras conocidas
+            frequencies: Frecuencias esperadas por letra (por defecto español)
+            workers: Procesos para contar letras en textos grandes
+                     (None = automático, 1 = sin paralelismo)
+            
+        Returns:
+            Lista de tuplas (llave, texto, puntaje, aciertos) de mejor a peor
+        """
+        message = ciphertext.strip().upper()
+        frequencies = frequencies or SPANISH_FREQUENCIES
+        
+        histogram = self._count_letters(message, workers)
+        total = sum(histogram)
+        
+        # Puntaje de cada llave rotando el histograma: con la llave k, la
+        # letra i del texto plano proviene de la letra (i + k) mod 26 cifrada
+        expected = [frequencies.get(letter, 0.0) / 100.0 for letter in LETTERS]
+        scores = []
+        for key in range(26):
+            chi = 0.0
+            for i in range(26):
+                e = expected[i] * total
+                if e > 0:
+                    observed = histogram[(i + key) % 26]
+                    chi += (observed - e) ** 2 / e
+            scores.append(chi)
+        
+        hits = [0] * 26
+        if dictionary:
+            words = set(word.upper() for word in dictionary)
+            sample = message.split()[:DICTIONARY_SAMPLE_WORDS]
+            sample_text = ' '.join(sample)
+            for key in range(26):
+                candidate = sample_text.translate(self._inverse_table(key))
+                hits[key] = sum(1 for word in candidate.split() if word in words)
+        
+        ranking = sorted(range(26), key=lambda k: (-hits[k], scores[k], k))
+        
+        results = []
+        for key in ranking[:top_k]:
+            plaintext = message.translate(self._inverse_table(key))
+            results.append((key, plaintext, scores[key], hits[key]))
+        return results
+    
+    def _count_letters(self, message, workers):
+        """
+        Cuenta las letras del mensaje, en paralelo si es muy largo.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1 or len(message) < PARALLEL_THRESHOLD:
+            return letter_histogram(message)
+        
+        size = -(-len(message) // workers)
+        chunks = [message[i:i + size] for i in range(0, len(message), size)]
+        histogram = [0] * 26
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for partial in executor.map(letter_histogram, chunks):
+                for i in range(26):
+                    histogram[i] += partial[i]
+        return histogram
+    
+    def _inverse_table(self, key):
+        """
+        Tabla de traducción que aplica D(x) = (x - k) mod 26 a las letras.
+        """
+        shifted = ''.join(self._shift_char_inverse(c, key) for c in LETTERS)
+        return str.maketrans(LETTERS, shifted)
+    
+    def load_generated_config(self, **options):
+        """
+        Carga una configuración generada para decriptar con run() sobre
+        cualquier alfabeto y rango de llaves.
+        
+        Args:
+            **options: Parámetros de config_generator.build_program()
+                       (alphabet, keys, letter_keys, passthrough, separator)
+        """
+        self.use_program(build_program('decrypt', **options))
+    
     def generate_transition_table(self, key):
         """
         Genera la tabla de transiciones específica para una llave dada.
@@ -9,6 +9,8 @@ Estrategia:
 4. Escribir el resultado cifrado
 """
 
+from src import metrics
+from src.config_generator import build_program
 from src.turing_machine import TuringMachine
 
 
@@ -52,6 +54,7 @@ class CaesarEncryptMachine(TuringMachine):
         # Las transiciones se generarán dinámicamente
         self.transitions = {}
     
+    @metrics.timed('caesar_helper_seconds', operation='encrypt')
     def encrypt(self, input_string, verbose=False):
         """
         Encripta un mensaje usando cifrado César.
@@ -152,6 +155,17 @@ class CaesarEncryptMachine(TuringMachine):
         # Convertir de vuelta a letra
         return chr(new_pos + ord('A'))
     
+    def load_generated_config(self, **options):
+        """
+        Carga una configuración generada para encriptar con run() sobre
+        cualquier alfabeto y rango de llaves.
+        
+        Args:
+            **options: Parámetros de config_generator.build_program()
+                       (alphabet, keys, letter_keys, passthrough, separator)
+        """
+        self.use_program(build_program('encrypt', **options))
+    
     def generate_transition_table(self, key):
         """
         Genera la tabla de transiciones específica para una llave dada.
@@ -0,0 +1,241 @@
+"""
+Analizador de Complejidad de Pasos
+Genera entradas de longitud creciente a partir del alfabeto de entrada de una
+configuración, las ejecuta contando pasos y espacio de cinta, y ajusta la
+curva de crecimiento (O(1), O(log n), O(n), O(n log n), O(n²), O(n³)).
+
+Sirve para elegir max_steps por configuración y para detectar que un cambio
+en la configuración vuelva cuadrática una máquina lineal.
+"""
+
+import math
+import random
+
+from src.turing_machine import TuringMachine
+
+
+# Modelos de crecimiento, de más simple a más complejo
+MODELS = [
+    ('O(1)', lambda n: 1.0),
+    ('O(log n)', lambda n: math.log2(n + 1)),
+    ('O(n)', lambda n: float(n)),
+    ('O(n log n)', lambda n: n * math.log2(n + 1)),
+    ('O(n²)', lambda n: float(n) ** 2),
+    ('O(n³)', lambda n: float(n) ** 3),
+]
+
+DEFAULT_LENGTHS = [8, 16, 32, 64, 128, 256, 512]
+
+# Un modelo más simple se prefiere si su error no supera al mejor en este factor
+SIMPLICITY_TOLERANCE = 1.1
+
+
+def guided_input(machine, length, rng):
+    """
+    Genera una entrada siguiendo la función de transición.
+
+    Cada vez que el cabezal llega a una celda todavía no generada se elige un
+    símbolo del alfabeto de entrada que tenga transición desde el estado
+    actual (evitando aceptar antes de tiempo), de modo que las entradas
+    recorran la máquina en lugar de rechazarse en el primer símbolo.
+
+    Args:
+        machine: TuringMachine con la configuración cargada
+        length: Longitud de la entrada
+        rng: Generador aleatorio
+
+    Returns:
+        Cadena de entrada de la longitud pedida
+    """
+    symbols = sorted(machine.input_alphabet)
+    cells = []
+    written = {}
+    state = machine.initial_state
+    head = 0
+
+    for _ in range(20 * length + 100):
+        if state in machine.accept_states:
+            break
+        if head in written:
+            symbol = written[head]
+        elif 0 <= head < len(cells):
+            symbol = cells[head]
+        elif head == len(cells) < length:
+            options = [s for s in symbols
+                       if (state, s) in machine.transitions
+                       and machine.transitions[(state, s)][0] not in machine.accept_states]
+            symbol = rng.choice(options or symbols)
+            cells.append(symbol)
+        else:
+            symbol = machine.blank_symbol
+
+        key = (state, symbol)
+        if key not in machine.transitions:
+            break
+        state, write, direction = machine.transitions[key]
+        written[head] = write
+        head += {'L': -1, 'R': 1}.get(direction, 0)
+
+    while len(cells) < length:
+        cells.append(rng.choice(symbols))
+    return ''.join(cells)
+
+
+def fit_growth(points):
+    """
+    Ajusta pasos ≈ a·f(n) + b para cada modelo por mínimos cuadrados.
+
+    Args:
+        points: Lista de tuplas (n, pasos)
+
+    Returns:
+        Tupla (modelo, a, b) con el modelo elegido
+    """
+    fits = []
+    for name, f in MODELS:
+        xs = [f(n) for n, _ in points]
+        ys = [float(y) for _, y in points]
+        count = len(points)
+        mean_x = sum(xs) / count
+        mean_y = sum(ys) / count
+        var_x = sum((x - mean_x) ** 2 for x in xs)
+        if var_x == 0:
+            a, b = 0.0, mean_y
+        else:
+            a = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+            b = mean_y - a * mean_x
+        if a < 0:
+            continue
+        error = sum((a * x + b - y) ** 2 for x, y in zip(xs, ys))
+        fits.append((error, name, a, b))
+
+    best = min(fit[0] for fit in fits)
+    for error, name, a, b in fits:
+        if error <= best * SIMPLICITY_TOLERANCE + 1e-9:
+            return name, a, b
+
+
+class ComplexityReport:
+    """
+    Resultado del análisis de una configuración.
+    """
+
+    def __init__(self, config_file, samples, model, a, b):
+        """
+        Args:
+            config_file: Configuración analizada
+            samples: Lista de tuplas (n, pasos, espacio, aceptada, entrada)
+            model: Modelo de crecimiento ajustado (por ejemplo 'O(n)')
+            a, b: Coeficientes del ajuste pasos ≈ a·f(n) + b
+        """
+        self.config_file = config_file
+        self.samples = samples
+        self.model = model
+        self.a = a
+        self.b = b
+
+    def estimate_steps(self, n):
+        """Pasos estimados para una entrada de longitud n."""
+        f = dict(MODELS)[self.model]
+        return self.a * f(n) + self.b
+
+    def suggest_max_steps(self, n, margin=2.0):
+        """
+        Valor de max_steps sugerido para entradas de hasta n símbolos.
+        """
+        return max(1, math.ceil(self.estimate_steps(n) * margin))
+
+    def worst_inputs(self, count=5):
+        """Las entradas que más pasos costaron."""
+        return sorted(self.samples, key=lambda sample: -sample[1])[:count]
+
+    @property
+    def max_space(self):
+        """Máximo de celdas de cinta usadas en el análisis."""
+        return max(sample[2] for sample in self.samples)
+
+    def summary(self):
+        """
+        Retorna el reporte en texto.
+        """
+        lines = [
+            f"Configuración: {self.config_file}",
+            f"Complejidad ajustada: {self.model} "
+            f"(pasos ≈ {self.a:.3f}·f(n) + {self.b:.1f})",
+            f"Espacio máximo de cinta: {self.max_space} celdas",
+            "Peores entradas:",
+        ]
+        for n, steps, space, accepted, text in self.worst_inputs():
+            shown = text if len(text) <= 40 else text[:37] + '...'
+            lines.append(f"  n={n:<6} pasos={steps:<8} espacio={space:<6} "
+                         f"{'aceptada' if accepted else 'rechazada'}  {shown!r}")
+        return '\n'.join(lines)
+
+
+def analyze_config(config_file, lengths=None, samples=20, seed=0, max_steps=10 ** 7):
+    """
+    Analiza el crecimiento de pasos de una configuración.
+
+    Para cada longitud se prueban entradas guiadas por las transiciones y
+    entradas aleatorias, y se ajusta la curva con el peor caso de cada longitud.
+
+    Args:
+        config_file: Archivo JSON de la MT
+        lengths: Longitudes de entrada a probar
+        samples: Entradas por longitud
+        seed: Semilla del generador
+        max_steps: Límite de pasos por ejecución
+
+    Returns:
+        ComplexityReport con el modelo ajustado y las muestras
+    """
+    rng = random.Random(seed)
+    machine = TuringMachine(config_file, tape_backend='list')
+    symbols = sorted(machine.input_alphabet)
+    lengths = lengths or DEFAULT_LENGTHS
+
+    results = []
+    worst = []
+    for n in lengths:
+        inputs = [guided_input(machine, n, rng) for _ in range(samples)]
+        inputs += [''.join(rng.choice(symbols) for _ in range(n)) for _ in range(samples // 4)]
+
+        length_worst = 0
+        for text in inputs:
+            accepted, _ = machine.run(text, max_steps=max_steps)
+            results.append((n, machine.steps, len(machine.tape), accepted, text))
+            length_worst = max(length_worst, machine.steps)
+        worst.append((n, length_worst))
+
+    model, a, b = fit_growth(worst)
+    return ComplexityReport(config_file, results, model, a, b)
+
+
+def main():
+    """Analiza una o más configuraciones desde la línea de comandos."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Análisis de complejidad de pasos de una MT")
+    parser.add_argument('config', nargs='+')
+    parser.add_argument('--lengths', type=int, nargs='+', default=DEFAULT_LENGTHS)
+    parser.add_argument('--samples', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--expect', help="Complejidad esperada, por ejemplo 'O(n)'")
+    parser.add_argument('--size', type=int, default=10000,
+                        help="Longitud para la que se sugiere max_steps")
+    args = parser.parse_args()
+
+    status = 0
+    for config_file in args.config:
+        report = analyze_config(config_file, args.lengths, args.samples, args.seed)
+        print(report.summary())
+        print(f"max_steps sugerido para n={args.size}: {report.suggest_max_steps(args.size)}")
+        if args.expect and report.model != args.expect:
+            print(f"✗ Se esperaba {args.expect}")
+            status = 1
+        print()
+    return status
+
+
+if __name__ == "__main__":
+    exit(main())
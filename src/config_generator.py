@@ -0,0 +1,216 @@
+"""
+Generador de Configuraciones César
+Produce configuraciones de MT de encriptación y decriptación para cualquier
+alfabeto (por ejemplo Latin-1 completo, o los 256 bytes para tráfico UTF-8) y
+cualquier conjunto de llaves, con el mismo formato que los archivos de config/.
+
+La llave se lee con un trie de decisión: hay un estado q_key_<prefijo> por
+cada prefijo de llave válido, así que leer la llave cuesta un paso por
+símbolo. Al leer el separador la máquina pasa al estado de desplazamiento de
+esa llave (q_enc_k o q_dec_k), que traduce cada celda del mensaje en un paso
+y acepta al llegar al blanco. Para una entrada "llave#mensaje" la máquina
+ejecuta |llave| + |mensaje| + 2 pasos, el mínimo para leer toda la entrada.
+
+Para tráfico UTF-8 se usa el alfabeto BYTES: el texto se codifica en UTF-8 y
+los bytes se pasan a la máquina como caracteres Latin-1
+(datos.decode('latin-1')).
+"""
+
+import json
+from functools import lru_cache
+
+from src.turing_machine import MachineProgram
+
+
+LETTERS = ''.join(chr(i) for i in range(ord('A'), ord('Z') + 1))
+LATIN1 = ''.join(chr(i) for i in list(range(32, 127)) + list(range(160, 256)))
+BYTES = ''.join(chr(i) for i in range(256))
+
+ALPHABETS = {'letters': LETTERS, 'latin1': LATIN1, 'bytes': BYTES}
+
+# Blancos candidatos, en orden, si el anterior pertenece al alfabeto
+BLANK_CANDIDATES = ['_', '\u2423', '\ue000']
+
+MODES = {'encrypt': ('q_enc_', 1), 'decrypt': ('q_dec_', -1)}
+
+
+def shift_transitions(mode, alphabet, key, state, passthrough='', blank='_',
+                      accept_state='q_accept'):
+    """
+    Transiciones del estado de desplazamiento de una llave.
+
+    Args:
+        mode: 'encrypt' o 'decrypt'
+        alphabet: Símbolos que se desplazan, en orden
+        key: Llave (se toma módulo el tamaño del alfabeto)
+        state: Nombre del estado de desplazamiento
+        passthrough: Símbolos que se copian sin cambios
+        blank: Símbolo blanco (al leerlo la máquina acepta)
+
+    Returns:
+        Diccionario (estado, símbolo) -> (siguiente, escritura, dirección)
+    """
+    sign = MODES[mode][1]
+    size = len(alphabet)
+    transitions = {}
+    for i, symbol in enumerate(alphabet):
+        transitions[(state, symbol)] = (state, alphabet[(i + sign * key) % size], 'R')
+    for symbol in passthrough:
+        transitions[(state, symbol)] = (state, symbol, 'R')
+    transitions[(state, blank)] = (accept_state, blank, 'S')
+    return transitions
+
+
+def _key_strings(keys, letter_keys, separator):
+    """
+    Cadenas de llave aceptadas: decimales y, opcionalmente, las letras A-Z
+    (A=0, B=1, ..., Z=25) cuyo valor está en keys, sea cual sea el alfabeto
+    del mensaje.
+    """
+    strings = {str(key): key for key in keys}
+    if letter_keys:
+        for i, symbol in enumerate(LETTERS):
+            if symbol != separator and str(i) in strings:
+                strings.setdefault(symbol, i)
+    return strings
+
+
+def generate_config(mode='encrypt', alphabet=LETTERS, keys=None, letter_keys=True,
+                    passthrough=' .', separator='#'):
+    """
+    Genera una configuración de MT de César.
+
+    Args:
+        mode: 'encrypt' o 'decrypt'
+        alphabet: Cadena con los símbolos que se desplazan, en orden
+        keys: Llaves aceptadas (enteros >= 0; por defecto 0..len(alphabet)-1)
+        letter_keys: Si True, las letras A-Z de las llaves en keys también son
+            llaves (A=0, ..., Z=25)
+        passthrough: Símbolos del mensaje que se copian sin cambios
+        separator: Símbolo entre la llave y el mensaje
+
+    Returns:
+        Diccionario con el formato de los archivos JSON de config/
+    """
+    if mode not in MODES:
+        raise ValueError(f"Modo desconocido: {mode!r}")
+    if len(set(alphabet)) != len(alphabet) or not alphabet:
+        raise ValueError("El alfabeto debe tener símbolos distintos")
+    keys = sorted(set(range(len(alphabet)) if keys is None else keys))
+    if any(key < 0 for key in keys):
+        raise ValueError("Las llaves deben ser enteros no negativos")
+    if separator.isdigit() or len(separator) != 1:
+        raise ValueError(f"Separador inválido: {separator!r}")
+    passthrough = ''.join(s for s in dict.fromkeys(passthrough) if s not in alphabet)
+
+    used = set(alphabet) | set(passthrough) | {separator}
+    blank = next((s for s in BLANK_CANDIDATES if s not in used), None)
+    if blank is None:
+        raise ValueError("No hay un símbolo blanco libre fuera del alfabeto")
+    prefix, _ = MODES[mode]
+    size = len(alphabet)
+
+    strings = _key_strings(keys, letter_keys, separator)
+
+    def key_state(node):
+        return 'q0' if node == '' else f"q_key_{node}"
+
+    transitions = {}
+    nodes = {''}
+    # Trie de la llave: un paso por símbolo, borrando la llave de la cinta
+    for string, key in sorted(strings.items(), key=lambda item: (len(item[0]), item[0])):
+        for i, symbol in enumerate(string):
+            transitions[(key_state(string[:i]), symbol)] = \
+                (key_state(string[:i + 1]), blank, 'R')
+            nodes.add(string[:i + 1])
+        transitions[(key_state(string), separator)] = (f"{prefix}{key % size}", blank, 'R')
+
+    shifts = sorted({key % size for key in strings.values()})
+    for shift in shifts:
+        transitions.update(shift_transitions(mode, alphabet, shift, f"{prefix}{shift}",
+                                             passthrough, blank))
+
+    key_symbols = {symbol for string in strings for symbol in string}
+    input_alphabet = used | key_symbols
+    states = [key_state(node) for node in sorted(nodes, key=lambda n: (len(n), n))]
+    states += [f"{prefix}{shift}" for shift in shifts] + ['q_accept']
+
+    return {
+        'description': f"Configuración generada de Máquina de Turing para "
+                       f"{'Encriptación' if mode == 'encrypt' else 'Decriptación'} César "
+                       f"({size} símbolos, {len(strings)} llaves)",
+        'states': states,
+        'input_alphabet': sorted(input_alphabet),
+        'tape_alphabet': sorted(input_alphabet | {blank}),
+        'initial_state': 'q0',
+        'accept_states': ['q_accept'],
+        'blank_symbol': blank,
+        'transitions': [
+            {'current_state': state, 'read_symbol': symbol, 'next_state': next_state,
+             'write_symbol': write, 'direction': direction}
+            for (state, symbol), (next_state, write, direction) in transitions.items()
+        ],
+    }
+
+
+def build_program(mode='encrypt', alphabet=LETTERS, keys=None, letter_keys=True,
+                  passthrough=' .', separator='#'):
+    """
+    Igual que generate_config(), pero retorna un MachineProgram. El resultado
+    se reutiliza para los mismos parámetros.
+    """
+    keys = None if keys is None else tuple(sorted(set(keys)))
+    return _build_program(mode, alphabet, keys, letter_keys, passthrough, separator)
+
+
+@lru_cache(maxsize=32)
+def _build_program(mode, alphabet, keys, letter_keys, passthrough, separator):
+    return MachineProgram.from_config(
+        generate_config(mode, alphabet, keys, letter_keys, passthrough, separator))
+
+
+def write_config(path, **kwargs):
+    """
+    Genera una configuración y la guarda como JSON.
+
+    Args:
+        path: Archivo de destino
+        **kwargs: Parámetros de generate_config()
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(generate_config(**kwargs), f, ensure_ascii=False, indent=2)
+
+
+def _parse_keys(text):
+    """Convierte '0-25,100' en la lista de llaves."""
+    keys = []
+    for part in text.split(','):
+        start, _, end = part.partition('-')
+        keys.extend(range(int(start), int(end or start) + 1))
+    return keys
+
+
+def main():
+    """Genera una configuración desde la línea de comandos."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generador de configuraciones de MT César")
+    parser.add_argument('mode', choices=sorted(MODES))
+    parser.add_argument('output')
+    parser.add_argument('--alphabet', default='letters',
+                        help=f"Uno de {sorted(ALPHABETS)} o los símbolos en orden")
+    parser.add_argument('--keys', help="Llaves, por ejemplo '0-25' o '0-999'")
+    parser.add_argument('--passthrough', default=' .')
+    parser.add_argument('--no-letter-keys', action='store_true')
+    args = parser.parse_args()
+
+    config = dict(mode=args.mode, alphabet=ALPHABETS.get(args.alphabet, args.alphabet),
+                  keys=_parse_keys(args.keys) if args.keys else None,
+                  letter_keys=not args.no_letter_keys, passthrough=args.passthrough)
+    write_config(args.output, **config)
+    print(f"Configuración guardada en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
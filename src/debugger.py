@@ -0,0 +1,289 @@
+"""
+Depurador con Viaje en el Tiempo para la Máquina de Turing
+Permite puntos de interrupción por estado, símbolo o número de paso, avanzar y
+retroceder paso a paso y saltar a cualquier paso.
+
+El historial no guarda copias de la cinta: cada paso se registra como un delta
+(posición, símbolo_anterior, estado_anterior, movimiento) en arreglos
+compactos, más puntos de control periódicos. Retroceder por una corrida de un
+millón de pasos usa memoria proporcional al número de pasos, no a pasos por
+longitud de cinta.
+"""
+
+from array import array
+
+
+class _DeltaLog:
+    """
+    Registro de deshacer: un delta por paso en arreglos paralelos.
+    Símbolos y estados se guardan como índices en tablas internas.
+    """
+
+    MOVES = {'L': -1, 'R': 1, 'S': 0}
+
+    def __init__(self):
+        self.positions = array('q')
+        self.old_symbols = array('i')   # -1 = la celda no existía
+        self.old_states = array('i')
+        self.moves = array('b')
+        self._symbols = []
+        self._symbol_codes = {}
+        self._states = []
+        self._state_codes = {}
+
+    def _intern(self, value, values, codes):
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def push(self, position, old_symbol, old_state, move):
+        self.positions.append(position)
+        self.old_symbols.append(-1 if old_symbol is None else
+                                self._intern(old_symbol, self._symbols, self._symbol_codes))
+        self.old_states.append(self._intern(old_state, self._states, self._state_codes))
+        self.moves.append(self.MOVES.get(move, 0))
+
+    def pop(self):
+        symbol = self.old_symbols.pop()
+        return (self.positions.pop(),
+                None if symbol < 0 else self._symbols[symbol],
+                self._states[self.old_states.pop()],
+                self.moves.pop())
+
+    def truncate(self, length):
+        for log in (self.positions, self.old_symbols, self.old_states, self.moves):
+            del log[length:]
+
+    def __len__(self):
+        return len(self.positions)
+
+
+class TuringDebugger:
+    """
+    Depurador paso a paso (hacia adelante y hacia atrás) de una TuringMachine.
+    """
+
+    def __init__(self, machine, checkpoint_interval=10000):
+        """
+        Args:
+            machine: TuringMachine con la configuración cargada
+            checkpoint_interval: Pasos entre puntos de control (0 = sin ellos)
+        """
+        self.machine = machine
+        self.checkpoint_interval = checkpoint_interval
+        self.breakpoints = []
+        self.log = _DeltaLog()
+        self.checkpoints = {}
+        self.step_count = 0
+
+    def load(self, input_string):
+        """
+        Coloca la entrada en la cinta y reinicia el historial.
+        """
+        self.machine.initialize_tape(input_string)
+        self.log = _DeltaLog()
+        self.checkpoints = {}
+        self.step_count = 0
+        self._checkpoint()
+
+    def _checkpoint(self):
+        m = self.machine
+        if self.checkpoint_interval and isinstance(m.tape, list) \
+                and self.step_count % self.checkpoint_interval == 0 \
+                and self.step_count not in self.checkpoints:
+            self.checkpoints[self.step_count] = (list(m.tape), m.head_position, m.current_state)
+
+    def add_breakpoint(self, state=None, symbol=None, step=None):
+        """
+        Agrega un punto de interrupción. Se detiene cuando coinciden todos los
+        campos indicados (estado actual, símbolo bajo el cabezal, número de paso).
+
+        Returns:
+            Índice del punto de interrupción
+        """
+        self.breakpoints.append((state, symbol, step))
+        return len(self.breakpoints) - 1
+
+    def remove_breakpoint(self, index):
+        """Elimina un punto de interrupción por su índice."""
+        self.breakpoints[index] = None
+
+    def _hit_breakpoint(self):
+        m = self.machine
+        for breakpoint in self.breakpoints:
+            if breakpoint is None:
+                continue
+            state, symbol, step = breakpoint
+            if (state is None or state == m.current_state) and \
+                    (symbol is None or symbol == m.read_symbol()) and \
+                    (step is None or step == self.step_count):
+                return breakpoint
+        return None
+
+    @property
+    def halted(self):
+        """True si la máquina aceptó o no tiene transición disponible."""
+        m = self.machine
+        if m.current_state in m.accept_states:
+            return True
+        return (m.current_state, m.read_symbol()) not in m.transitions
+
+    def step_forward(self):
+        """
+        Ejecuta un paso registrando su delta.
+
+        Returns:
+            True si se ejecutó el paso, False si la máquina se detuvo
+        """
+        m = self.machine
+        if m.current_state in m.accept_states:
+            return False
+        position = m.head_position
+        old_symbol = m.tape[position] if 0 <= position < len(m.tape) else None
+        old_state = m.current_state
+        transition = m.transitions.get((old_state, m.read_symbol()))
+        if transition is None or not m.step():
+            return False
+        self.log.push(position, old_symbol, old_state, transition[2])
+        self.step_count += 1
+        self._checkpoint()
+        return True
+
+    def step_back(self):
+        """
+        Deshace el último paso.
+
+        Returns:
+            True si se retrocedió, False si ya se está en el paso 0
+        """
+        if not len(self.log):
+            return False
+        m = self.machine
+        position, old_symbol, old_state, _ = self.log.pop()
+        if old_symbol is None:
+            # La escritura había hecho crecer la cinta por uno de sus extremos
+            m.tape.pop(0 if position < 0 else -1)
+        else:
+            m.tape[position] = old_symbol
+        m.head_position = position
+        m.current_state = old_state
+        self.step_count -= 1
+        return True
+
+    def continue_(self, max_steps=100000):
+        """
+        Avanza hasta un punto de interrupción, hasta detenerse o hasta max_steps.
+
+        Returns:
+            'breakpoint', 'halted' o 'max_steps'
+        """
+        for _ in range(max_steps):
+            if not self.step_forward():
+                return 'halted'
+            if self._hit_breakpoint():
+                return 'breakpoint'
+        return 'max_steps'
+
+    def jump_to(self, target):
+        """
+        Salta al paso indicado (hacia adelante o hacia atrás).
+        Hacia atrás usa el punto de control más cercano si reejecutar desde
+        él es más barato que deshacer paso por paso (solo con cinta de lista;
+        las otras cintas se restauran con los deltas, sin reemplazarlas).
+
+        Returns:
+            Paso en el que quedó el depurador
+        """
+        target = max(0, target)
+        m = self.machine
+        if target < self.step_count:
+            nearest = max((c for c in self.checkpoints if c <= target), default=None)
+            if nearest is not None and isinstance(m.tape, list) \
+                    and target - nearest < self.step_count - target:
+                tape, head, state = self.checkpoints[nearest]
+                m.tape[:] = tape
+                m.head_position = head
+                m.current_state = state
+                self.log.truncate(nearest)
+                self.step_count = nearest
+            while self.step_count > target:
+                self.step_back()
+        while self.step_count < target and self.step_forward():
+            pass
+        return self.step_count
+
+    def show(self, radius=30):
+        """
+        Imprime la configuración con una ventana de la cinta alrededor del cabezal.
+        """
+        m = self.machine
+        head = m.head_position
+        start = max(0, head - radius)
+        end = min(len(m.tape), head + radius + 1)
+        window = ''.join(m.tape[i] for i in range(start, end))
+        print(f"Paso {self.step_count} | Estado: {m.current_state} | Cabezal: {head}")
+        print(f"Cinta:  {'…' if start > 0 else ''}{window}{'…' if end < len(m.tape) else ''}")
+        print(f"        {' ' * (head - start + (1 if start > 0 else 0))}^")
+
+    def repl(self):
+        """
+        Bucle interactivo de comandos del depurador.
+        """
+        print("Comandos: s [n] avanzar | b [n] retroceder | c continuar | j N saltar")
+        print("          bp estado=Q simbolo=X paso=N | p mostrar | q salir")
+        self.show()
+        while True:
+            try:
+                parts = input("(mt-dbg) ").split()
+            except EOFError:
+                break
+            if not parts:
+                continue
+            command, args = parts[0], parts[1:]
+            count = int(args[0]) if args and args[0].isdigit() else 1
+            if command == 'q':
+                break
+            elif command == 's':
+                for _ in range(count):
+                    if not self.step_forward():
+                        print("La máquina se detuvo")
+                        break
+            elif command == 'b':
+                for _ in range(count):
+                    if not self.step_back():
+                        break
+            elif command == 'c':
+                print(f"Detenido: {self.continue_()}")
+            elif command == 'j' and args:
+                self.jump_to(int(args[0]))
+            elif command == 'bp':
+                fields = dict(arg.split('=', 1) for arg in args if '=' in arg)
+                step = fields.get('paso')
+                index = self.add_breakpoint(fields.get('estado'), fields.get('simbolo'),
+                                            int(step) if step else None)
+                print(f"Punto de interrupción {index} agregado")
+                continue
+            elif command != 'p':
+                print("Comando desconocido")
+                continue
+            self.show()
+
+
+def main():
+    """Depura una entrada con una configuración desde la línea de comandos."""
+    import sys
+    from src.turing_machine import TuringMachine
+
+    if len(sys.argv) != 3:
+        print("Uso: python3 -m src.debugger config.json 'llave#MENSAJE'")
+        return 1
+    debugger = TuringDebugger(TuringMachine(sys.argv[1]))
+    debugger.load(sys.argv[2])
+    debugger.repl()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
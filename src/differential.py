@@ -0,0 +1,248 @@
+"""
+Arnés de Pruebas Diferenciales
+Compara la máquina de referencia (TuringMachine.run con la configuración JSON)
+contra los motores alternativos y los métodos auxiliares encrypt/decrypt.
+
+Para cada entrada generada se verifica que todos los motores devuelvan el
+mismo (accepted, output) y el mismo número de pasos. Los casos que fallan se
+reducen (shrinking) hasta una entrada mínima que sigue mostrando la diferencia.
+"""
+
+import os
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from src.turing_machine import TuringMachine
+from src.parallel import ParallelTuringMachine
+from src.caesar_encrypt import create_encrypt_machine
+from src.caesar_decrypt import create_decrypt_machine
+
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config')
+
+MODES = {
+    'encrypt': os.path.join(CONFIG_DIR, 'encrypt_config.json'),
+    'decrypt': os.path.join(CONFIG_DIR, 'decrypt_config.json'),
+}
+
+# Motores comparados contra la referencia: nombre -> fábrica(config_file).
+# Cada motor debe ofrecer run(input_string, max_steps) -> (accepted, output)
+# y dejar el número de pasos en el atributo steps.
+ENGINES = {}
+
+# Prefijos mal formados que se combinan con mensajes aleatorios
+MALFORMED_PREFIXES = [
+    '', '#', '##', '3', '3##', '03#', '003#', '-3#', '+3#', '26#', '99#',
+    '100#', 'DX#', 'AB#', '3D#', ' 3#', '3 #', 'a#', '_#', '.#', '3#_',
+]
+
+# Llave válida para los auxiliares y las configuraciones JSON, y mensaje sin
+# espacios en los extremos (los auxiliares aplican strip a la entrada)
+_WELL_FORMED = re.compile(r'^(?:[0-9]|1[0-9]|2[0-5]|[A-Z])#(?:[A-Z.](?:[A-Z .]*[A-Z.])?)?$')
+
+
+def register_engine(name, factory):
+    """
+    Registra un motor alternativo para el arnés diferencial.
+
+    Args:
+        name: Nombre del motor
+        factory: Función que recibe la ruta de configuración y devuelve el motor
+    """
+    ENGINES[name] = factory
+
+
+register_engine('mmap', lambda config_file: TuringMachine(config_file, tape_backend='mmap'))
+register_engine('rope', lambda config_file: TuringMachine(config_file, tape_backend='rope'))
+# Umbral bajo para que los mensajes largos pasen por los procesos trabajadores
+register_engine('parallel', lambda config_file: ParallelTuringMachine(
+    config_file, tape_backend='mmap', workers=2, parallel_threshold=256))
+
+
+def generate_cases(config_file, count=200, seed=0, max_length=300):
+    """
+    Genera entradas aleatorias y adversariales para una configuración.
+
+    Args:
+        config_file: Configuración de la MT (de ahí se toma el alfabeto)
+        count: Número de entradas aleatorias adicionales
+        seed: Semilla para reproducir la generación
+        max_length: Longitud máxima de los mensajes largos
+
+    Returns:
+        Lista de cadenas de entrada
+    """
+    rng = random.Random(seed)
+    machine = TuringMachine(config_file)
+    alphabet = sorted(machine.input_alphabet)
+    letters = [chr(i) for i in range(ord('A'), ord('Z') + 1)]
+    noise = alphabet + ['a', 'z', ',', '!', '_', '#', '\t']
+
+    def message(length, symbols=letters + [' ']):
+        return ''.join(rng.choice(symbols) for _ in range(length))
+
+    cases = []
+
+    # Todas las llaves, numéricas y alfabéticas
+    for key in range(26):
+        cases.append(f"{key}#{message(rng.randint(0, 20))}")
+        cases.append(f"{letters[key]}#{message(rng.randint(0, 20))}")
+
+    # Mensajes largos y con puntuación
+    for _ in range(5):
+        key = rng.randint(0, 25)
+        cases.append(f"{key}#{message(max_length)}")
+        cases.append(f"{key}#{message(rng.randint(1, 40), letters + [' ', '.', ',', '!', 'a'])}")
+
+    # Prefijos mal formados
+    for prefix in MALFORMED_PREFIXES:
+        cases.append(prefix + message(rng.randint(0, 10)))
+
+    # Cadenas completamente aleatorias sobre el alfabeto (con ruido)
+    for _ in range(count):
+        cases.append(message(rng.randint(0, 30), noise))
+
+    return cases
+
+
+def _helper_for(config_file):
+    """
+    Devuelve el método auxiliar (encrypt/decrypt) equivalente a la configuración.
+    """
+    name = os.path.basename(config_file)
+    if name == os.path.basename(MODES['encrypt']):
+        return create_encrypt_machine().encrypt
+    if name == os.path.basename(MODES['decrypt']):
+        return create_decrypt_machine().decrypt
+    return None
+
+
+class _Checker:
+    """
+    Ejecuta una entrada en la referencia, los motores y el auxiliar.
+    """
+
+    def __init__(self, config_file, max_steps):
+        self.max_steps = max_steps
+        self.reference = TuringMachine(config_file)
+        self.engines = {name: factory(config_file) for name, factory in ENGINES.items()}
+        self.helper = _helper_for(config_file)
+
+    def mismatch(self, input_string):
+        """
+        Returns:
+            Descripción de la diferencia encontrada, o None si todo coincide
+        """
+        accepted, output = self.reference.run(input_string, max_steps=self.max_steps)
+        expected = (accepted, output, self.reference.steps)
+
+        for name, engine in self.engines.items():
+            result = engine.run(input_string, max_steps=self.max_steps)
+            obtained = (result[0], result[1], engine.steps)
+            if obtained != expected:
+                return f"{name}: esperado {expected!r}, obtenido {obtained!r}"
+
+        # Los auxiliares normalizan la entrada (strip/upper), no rechazan y no
+        # tienen límite de pasos: solo se comparan sobre entradas bien formadas
+        # que la referencia terminó de procesar
+        exhausted = not accepted and self.reference.steps >= self.max_steps
+        if self.helper and not exhausted and _WELL_FORMED.match(input_string):
+            helper_output = self.helper(input_string)
+            if not accepted or helper_output != output:
+                return f"auxiliar: esperado {output!r}, obtenido {helper_output!r}"
+
+        return None
+
+    def shrink(self, input_string):
+        """
+        Reduce una entrada que falla eliminando fragmentos mientras siga fallando.
+        """
+        current = input_string
+        chunk = max(1, len(current) // 2)
+        while chunk >= 1:
+            i = 0
+            reduced = False
+            while i < len(current):
+                candidate = current[:i] + current[i + chunk:]
+                if self.mismatch(candidate) is not None:
+                    current = candidate
+                    reduced = True
+                else:
+                    i += chunk
+            if not reduced:
+                chunk //= 2
+        return current
+
+
+_worker_checker = None
+
+
+def _init_worker(config_file, max_steps):
+    global _worker_checker
+    _worker_checker = _Checker(config_file, max_steps)
+
+
+def _check_shard(cases):
+    failures = []
+    for input_string in cases:
+        description = _worker_checker.mismatch(input_string)
+        if description is not None:
+            minimal = _worker_checker.shrink(input_string)
+            failures.append((input_string, minimal, _worker_checker.mismatch(minimal)))
+    return failures
+
+
+def run_differential(config_file, cases, max_steps=100000, processes=None):
+    """
+    Ejecuta el arnés diferencial sobre una lista de entradas.
+
+    Args:
+        config_file: Configuración de la MT de referencia
+        cases: Entradas a comparar
+        max_steps: Máximo de pasos por ejecución (igual para todos los motores)
+        processes: Procesos a usar (None = automático, 1 = en este proceso)
+
+    Returns:
+        Lista de tuplas (entrada, entrada_mínima, descripción) con las diferencias
+    """
+    if processes is None:
+        processes = min(os.cpu_count() or 1, max(1, len(cases) // 50))
+
+    if processes <= 1:
+        _init_worker(config_file, max_steps)
+        return _check_shard(cases)
+
+    shards = [cases[i::processes] for i in range(processes)]
+    failures = []
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(config_file, max_steps)) as executor:
+        for shard_failures in executor.map(_check_shard, shards):
+            failures.extend(shard_failures)
+    return failures
+
+
+def main():
+    """Ejecuta el arnés sobre las configuraciones de encriptación y decriptación."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pruebas diferenciales de las MT César")
+    parser.add_argument('--count', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-steps', type=int, default=100000)
+    parser.add_argument('--processes', type=int, default=None)
+    args = parser.parse_args()
+
+    total_failures = 0
+    for mode, config_file in MODES.items():
+        cases = generate_cases(config_file, count=args.count, seed=args.seed)
+        failures = run_differential(config_file, cases, args.max_steps, args.processes)
+        print(f"{mode}: {len(cases)} casos, {len(failures)} diferencias")
+        for original, minimal, description in failures:
+            print(f"  {original!r} -> mínimo {minimal!r}: {description}")
+        total_failures += len(failures)
+    return 1 if total_failures else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,279 @@
+"""
+Métricas del Simulador
+Contadores e histogramas de las ejecuciones (resultado, pasos, longitud de
+cinta, latencia), del tiempo de carga de configuraciones y de los métodos
+auxiliares de César, exportables en el formato de texto de Prometheus y como
+instantáneas JSON periódicas en un archivo.
+
+Cada hilo acumula en su propio fragmento (threading.local), así que registrar
+un valor no toma ningún candado; los fragmentos solo se combinan al exportar.
+Los fragmentos de los hilos que terminaron se combinan en uno solo cuando se
+registra un hilo nuevo o al exportar, así que la memoria depende de los hilos
+vivos y no de todos los que tuvo el proceso.
+Cada proceso tiene su propio registro: con varios procesos, cada uno exporta
+el suyo (por ejemplo un archivo JSON por pid).
+"""
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+
+
+STEP_BUCKETS = (10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8)
+LATENCY_BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1.0, 10.0, 100.0)
+
+# Métricas conocidas: nombre -> (tipo, descripción, límites de los buckets)
+METRICS = {
+    'tm_runs_total': ('counter', "Ejecuciones de la MT por resultado", None),
+    'tm_run_steps': ('histogram', "Pasos por ejecución", STEP_BUCKETS),
+    'tm_run_tape_cells': ('histogram', "Celdas de cinta al terminar una ejecución", STEP_BUCKETS),
+    'tm_run_seconds': ('histogram', "Duración de cada ejecución en segundos", LATENCY_BUCKETS),
+    'tm_config_load_seconds': ('histogram', "Tiempo de carga de una configuración", LATENCY_BUCKETS),
+    'caesar_helper_seconds': ('histogram', "Duración de los métodos auxiliares de César",
+                              LATENCY_BUCKETS),
+}
+
+
+class _Shard:
+    """Acumuladores de un solo hilo."""
+
+    def __init__(self):
+        self.counters = {}      # (nombre, etiquetas) -> valor
+        self.histograms = {}    # (nombre, etiquetas) -> [conteos..., suma, total]
+
+
+class MetricsRegistry:
+    """
+    Registro de métricas con agregación por hilo.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = {}           # hilo -> fragmento
+        self._retired = _Shard()    # Valores de los hilos que ya terminaron
+        self._shards_lock = threading.Lock()
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            # Primera métrica de este hilo: el único momento en que se bloquea
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                self._retire()
+                self._shards[threading.current_thread()] = shard
+            return shard
+
+    def _retire(self):
+        """
+        Combina en un solo fragmento los de los hilos que terminaron (se
+        llama con el candado tomado).
+        """
+        for thread in [thread for thread in self._shards if not thread.is_alive()]:
+            _merge(self._retired, self._shards.pop(thread))
+
+    def inc(self, name, value=1, **labels):
+        """
+        Incrementa un contador.
+
+        Args:
+            name: Nombre de la métrica
+            value: Incremento
+            **labels: Etiquetas (por ejemplo outcome='accepted')
+        """
+        counters = self._shard().counters
+        key = (name, tuple(sorted(labels.items())) if labels else ())
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """
+        Registra un valor en un histograma.
+
+        Args:
+            name: Nombre de la métrica
+            value: Valor observado
+            **labels: Etiquetas
+        """
+        histograms = self._shard().histograms
+        key = (name, tuple(sorted(labels.items())) if labels else ())
+        cells = histograms.get(key)
+        if cells is None:
+            cells = histograms[key] = [0] * (len(_buckets(name)) + 1) + [0, 0]
+        cells[bisect_left(_buckets(name), value)] += 1
+        cells[-2] += value
+        cells[-1] += 1
+
+    def collect(self):
+        """
+        Combina los fragmentos de todos los hilos.
+
+        Returns:
+            Tupla (contadores, histogramas) con las claves (nombre, etiquetas)
+        """
+        total = _Shard()
+        with self._shards_lock:
+            self._retire()
+            _merge(total, self._retired)
+            shards = list(self._shards.values())
+        for shard in shards:
+            _merge(total, shard)
+        return total.counters, total.histograms
+
+    def reset(self):
+        """Descarta todos los valores acumulados."""
+        with self._shards_lock:
+            self._retired = _Shard()
+            for shard in self._shards.values():
+                shard.counters.clear()
+                shard.histograms.clear()
+
+    def snapshot(self):
+        """
+        Retorna el estado de las métricas como diccionario serializable a JSON.
+        """
+        counters, histograms = self.collect()
+        result = {'timestamp': time.time(), 'pid': os.getpid(), 'counters': [], 'histograms': []}
+        for (name, labels), value in sorted(counters.items()):
+            result['counters'].append({'name': name, 'labels': dict(labels), 'value': value})
+        for (name, labels), cells in sorted(histograms.items()):
+            cumulative = 0
+            buckets = []
+            for bound, count in zip(_buckets(name) + ('+Inf',), cells):
+                cumulative += count
+                buckets.append([bound, cumulative])
+            result['histograms'].append({'name': name, 'labels': dict(labels),
+                                         'buckets': buckets, 'sum': cells[-2],
+                                         'count': cells[-1]})
+        return result
+
+    def prometheus(self):
+        """
+        Retorna las métricas en el formato de texto de exposición de Prometheus.
+        """
+        snapshot = self.snapshot()
+        lines = []
+        described = set()
+
+        def describe(name, kind):
+            if name not in described:
+                described.add(name)
+                help_text = METRICS.get(name, (kind, name, None))[1]
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        for counter in snapshot['counters']:
+            describe(counter['name'], 'counter')
+            lines.append(f"{counter['name']}{_labels(counter['labels'])} {counter['value']}")
+        for histogram in snapshot['histograms']:
+            name, labels = histogram['name'], histogram['labels']
+            describe(name, 'histogram')
+            for bound, count in histogram['buckets']:
+                lines.append(f"{name}_bucket{_labels(dict(labels, le=str(bound)))} {count}")
+            lines.append(f"{name}_sum{_labels(labels)} {histogram['sum']}")
+            lines.append(f"{name}_count{_labels(labels)} {histogram['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path):
+        """
+        Escribe una instantánea JSON (reemplazando el archivo de forma atómica).
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False)
+        os.replace(temporary, path)
+
+
+def _merge(target, shard):
+    """
+    Suma los valores de shard en target (sin modificar las listas de shard,
+    que su hilo puede seguir actualizando).
+    """
+    for key, value in dict(shard.counters).items():
+        target.counters[key] = target.counters.get(key, 0) + value
+    for key, cells in dict(shard.histograms).items():
+        cells = list(cells)
+        total = target.histograms.get(key)
+        target.histograms[key] = cells if total is None else [a + b for a, b in zip(total, cells)]
+
+
+def _buckets(name):
+    definition = METRICS.get(name)
+    return definition[2] if definition and definition[2] else LATENCY_BUCKETS
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for value in labels.values())
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + '}'
+
+
+# Registro por defecto del proceso
+registry = MetricsRegistry()
+
+
+def record_run(outcome, steps, tape_cells, seconds):
+    """
+    Registra una ejecución terminada de la MT (una sola vez por ejecución,
+    fuera del bucle de pasos).
+    """
+    registry.inc('tm_runs_total', outcome=outcome)
+    registry.observe('tm_run_steps', steps)
+    registry.observe('tm_run_tape_cells', tape_cells)
+    registry.observe('tm_run_seconds', seconds)
+
+
+def timed(name, **labels):
+    """
+    Decorador que registra la duración de cada llamada en el histograma name.
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                registry.observe(name, time.perf_counter() - start, **labels)
+        return wrapper
+    return decorator
+
+
+class SnapshotWriter:
+    """
+    Escribe instantáneas JSON del registro cada cierto intervalo en un hilo.
+    """
+
+    def __init__(self, path, interval=10.0, metrics=None):
+        """
+        Args:
+            path: Archivo JSON de destino
+            interval: Segundos entre instantáneas
+            metrics: MetricsRegistry (por defecto el registro del proceso)
+        """
+        self.path = path
+        self.interval = interval
+        self.metrics = metrics or registry
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Inicia el hilo de escritura."""
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.metrics.write_json(self.path)
+
+    def stop(self):
+        """Detiene el hilo y escribe una última instantánea."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.metrics.write_json(self.path)
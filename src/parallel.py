@@ -0,0 +1,240 @@
+"""
+Barridos Paralelos sobre una Misma Entrada
+Una vez leída la llave, la máquina de César recorre el mensaje en un único
+estado q_enc_k que nunca cambia con los símbolos de contenido: cada celda se
+traduce de forma independiente. ParallelTuringMachine detecta esos estados de
+barrido (todas sus transiciones sobre símbolos no blancos vuelven al mismo
+estado moviéndose a la derecha) y, en lugar de avanzar paso a paso, traduce de
+una vez el tramo de la cinta que va desde el cabezal hasta el primer símbolo
+que sale del lazo, sumando exactamente los pasos que la máquina habría
+ejecutado y respetando max_steps.
+
+Con una cinta MMapTape los tramos grandes se reparten entre procesos
+trabajadores que mapean el archivo de la cinta y trabajan sobre él en su
+lugar: primero cada uno busca en su segmento el primer símbolo que sale del
+lazo y después traducen hasta ese punto (bytes.translate), sin pasar las
+celdas por el proceso principal. El grupo de procesos se crea una vez por
+máquina. Con una cinta de lista el barrido ocurre en el proceso principal
+(str.translate por ventanas): evita el bucle de pasos, pero no aprovecha más
+núcleos.
+"""
+
+import mmap
+import os
+import re
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from src.pipeline import sweep_loops
+from src.tape import MMapTape
+from src.turing_machine import TuringMachine
+
+
+# Celdas de cinta que se leen y traducen por ventana en el proceso principal
+SWEEP_WINDOW = 64 * 1024 * 1024
+
+# Tramos más cortos que esto se traducen en el mismo proceso
+PARALLEL_SWEEP_THRESHOLD = 8 * 1024 * 1024
+
+# Pasos normales entre revisiones de si la máquina entró a un barrido
+SWEEP_PROBE_STEPS = 32
+
+# Bytes que un trabajador traduce de una vez dentro de su segmento
+WORKER_CHUNK = 16 * 1024 * 1024
+
+
+def _map_segment(path, offset, length):
+    """
+    Mapea [offset, offset + length) del archivo de la cinta.
+
+    Returns:
+        Tupla (mapa, posición del segmento dentro del mapa)
+    """
+    aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+    with open(path, 'r+b') as f:
+        segment = mmap.mmap(f.fileno(), length + offset - aligned, offset=aligned)
+    return segment, offset - aligned
+
+
+def _find_leave(path, offset, length, codes):
+    """
+    Posición del primer byte del segmento que no pertenece al lazo, o length
+    si todo el segmento se barre (se ejecuta en un proceso trabajador).
+    """
+    segment, base = _map_segment(path, offset, length)
+    try:
+        leave = re.compile(b'[^' + re.escape(codes) + b']') if codes else re.compile(b'.', re.DOTALL)
+        match = leave.search(segment, base, base + length)
+        return match.start() - base if match else length
+    finally:
+        segment.close()
+
+
+def _translate_segment(path, offset, length, table):
+    """
+    Traduce en su lugar el segmento del archivo de la cinta (se ejecuta en un
+    proceso trabajador).
+    """
+    segment, base = _map_segment(path, offset, length)
+    try:
+        for start in range(base, base + length, WORKER_CHUNK):
+            end = min(start + WORKER_CHUNK, base + length)
+            segment[start:end] = segment[start:end].translate(table)
+        segment.flush()
+    finally:
+        segment.close()
+
+
+class ParallelTuringMachine(TuringMachine):
+    """
+    TuringMachine que ejecuta los estados de barrido por tramos, en paralelo
+    cuando el tramo es grande y la cinta es MMapTape. Produce la misma cinta,
+    estado y número de pasos que la ejecución paso a paso.
+    """
+
+    def __init__(self, config_file=None, tape_backend='auto', workers=None,
+                 parallel_threshold=PARALLEL_SWEEP_THRESHOLD):
+        """
+        Args:
+            config_file: Ruta al archivo JSON con la configuración
+            tape_backend: Igual que en TuringMachine ('mmap' para usar procesos)
+            workers: Procesos trabajadores (None = núcleos disponibles)
+            parallel_threshold: Longitud mínima de un tramo para usar procesos
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        self.sweeps = {}
+        self._pool = None
+        super().__init__(config_file, tape_backend)
+
+    def use_program(self, program):
+        super().use_program(program)
+        self.sweeps = sweep_loops(program)
+
+    def close(self):
+        """Termina los procesos trabajadores (se vuelven a crear si hacen falta)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers)
+            weakref.finalize(self, self._pool.shutdown)
+        return self._pool
+
+    def run_for(self, steps=1000, cancel=None, verbose=False):
+        """
+        Igual que TuringMachine.run_for(), pero los estados de barrido avanzan
+        por tramos completos en lugar de paso a paso.
+        """
+        if verbose or not self.sweeps:
+            return super().run_for(steps, cancel, verbose)
+        if self.status is not None \
+                or (cancel is not None and cancel.is_set()) \
+                or (self.deadline is not None and time.monotonic() >= self.deadline):
+            # Cancelación y tiempo límite se revisan antes de trabajar, como en
+            # la clase base (que deja el motivo de término en status)
+            return super().run_for(0, cancel)
+
+        target = self.steps + steps
+        while True:
+            budget = min(target, self.max_steps) - self.steps
+            if self.status is None and budget > 0 \
+                    and self.current_state not in self.accept_states:
+                swept = self._sweep(budget)
+                if swept:
+                    self.steps += swept
+                    continue
+            progress = super().run_for(min(SWEEP_PROBE_STEPS, target - self.steps), cancel)
+            if progress.done or self.steps >= target:
+                return progress
+
+    def _sweep(self, budget):
+        """
+        Avanza el barrido del estado actual a lo sumo budget pasos.
+
+        Returns:
+            Pasos ejecutados (0 si el estado actual no es de barrido)
+        """
+        sweep = self.sweeps.get(self.current_state)
+        head = self.head_position
+        if sweep is None or head < 0:
+            return 0
+        if isinstance(self.tape, list):
+            read, write = self._read_list, self._write_list
+        elif hasattr(self.tape, 'read_range'):
+            read, write = self.tape.read_range, self.tape.write_range
+        else:
+            return 0
+
+        table, leave = sweep
+        end = min(len(self.tape), head + budget)
+        if isinstance(self.tape, MMapTape) and self.workers > 1 \
+                and end - head >= self.parallel_threshold:
+            done = self._sweep_workers(head, end, table)
+            if done is not None:
+                self.head_position = head + done
+                return done
+
+        done = 0
+        while done < budget:
+            start = head + done
+            end = min(len(self.tape), start + min(SWEEP_WINDOW, budget - done))
+            if start >= end:
+                break
+            text = read(start, end)
+            match = leave.search(text)
+            stop = match.start() if match else len(text)
+            if stop:
+                write(start, (text[:stop] if stop < len(text) else text).translate(table))
+            done += stop
+            if stop < len(text):
+                break
+
+        self.head_position = head + done
+        return done
+
+    def _read_list(self, start, end):
+        return ''.join(self.tape[start:end])
+
+    def _write_list(self, start, text):
+        self.tape[start:start + len(text)] = text
+
+    def _sweep_workers(self, start, end, table):
+        """
+        Barre las celdas [start, end) de una MMapTape con los procesos
+        trabajadores, directamente sobre el archivo de la cinta.
+
+        Returns:
+            Pasos ejecutados, o None si el tramo no se puede mapear
+        """
+        region = self.tape.shared_region(start, end)
+        if region is None:
+            return None
+        path, offset = region
+        codes, loop = self.tape.code_table(table)
+        pool = self._executor()
+
+        length = end - start
+        size = -(-length // self.workers)
+        bounds = [(first, min(first + size, length)) for first in range(0, length, size)]
+
+        # Cada trabajador busca la salida del lazo en su segmento; el barrido
+        # termina en la primera que aparezca
+        stop = length
+        found = pool.map(_find_leave, repeat(path), [offset + first for first, _ in bounds],
+                         [last - first for first, last in bounds], repeat(loop))
+        for (first, last), position in zip(bounds, found):
+            if position < last - first:
+                stop = first + position
+                break
+
+        if stop:
+            size = -(-stop // self.workers)
+            bounds = [(first, min(first + size, stop)) for first in range(0, stop, size)]
+            list(pool.map(_translate_segment, repeat(path), [offset + first for first, _ in bounds],
+                          [last - first for first, last in bounds], repeat(codes)))
+        return stop
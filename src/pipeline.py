@@ -0,0 +1,300 @@
+"""
+Tuberías de Máquinas de Turing
+Compone varios programas de MT (por ejemplo encriptar → decriptar) de modo
+que la cinta de salida de una etapa sea la entrada de la siguiente sin
+construir cadenas intermedias.
+
+Hay dos modos:
+- Cinta compartida: cada etapa se ejecuta completa y la lista de la cinta se
+  compacta (sin blancos, con el prefijo de la etapa siguiente) y se entrega
+  tal cual a la siguiente máquina.
+- Flujo: si todas las etapas son transductores que solo se mueven a la
+  derecha, la entrada se procesa por fragmentos y cada etapa consume los
+  fragmentos de la anterior a medida que se producen, así que un trabajo de
+  varias etapas ocupa la memoria de un fragmento por etapa.
+"""
+
+import queue
+import re
+import threading
+import time
+from itertools import chain
+
+from src import metrics
+from src.turing_machine import MachineProgram, load_program
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def is_streamable(program):
+    """
+    True si la máquina es un transductor que solo se mueve a la derecha:
+    toda transición mueve 'R', salvo las que entran a un estado de aceptación.
+    """
+    return all(direction == 'R' or next_state in program.accept_states
+               for next_state, _, direction in program.transitions.values())
+
+
+def sweep_loops(program):
+    """
+    Tramos de barrido de cada estado: símbolos (distintos del blanco) sobre
+    los que el estado se repite moviéndose a la derecha.
+
+    Returns:
+        Diccionario estado -> (tabla_de_traducción, regex_de_salida_del_lazo)
+    """
+    loops = {}
+    for (state, symbol), (next_state, write, direction) in program.transitions.items():
+        if direction == 'R' and next_state == state and symbol != program.blank_symbol \
+                and len(symbol) == 1 and len(write) == 1:
+            loops.setdefault(state, {})[symbol] = write
+
+    tables = {}
+    for state, mapping in loops.items():
+        body = ''.join(re.escape(s) for s in sorted(mapping))
+        tables[state] = (str.maketrans(mapping), re.compile(f"[^{body}]"))
+    return tables
+
+
+def _transduce(program, chunks, max_steps, result):
+    """
+    Ejecuta un transductor que se mueve a la derecha sobre fragmentos de entrada.
+
+    Produce fragmentos de salida equivalentes al contenido final de la cinta
+    (sin blancos), deja en result el estado final ('status', 'steps') y
+    registra la ejecución en las métricas al terminar.
+    """
+    started = time.perf_counter()
+    transitions = program.transitions
+    accept_states = program.accept_states
+    blank = program.blank_symbol
+    loops = sweep_loops(program)
+    state = program.initial_state
+    steps = 0
+    status = None
+    cells = 0
+
+    for chunk in chunks:
+        cells += len(chunk)
+        if status is not None:
+            # La máquina se detuvo: el resto de la entrada queda igual en la cinta
+            yield chunk.replace(blank, '')
+            continue
+
+        out = []
+        i = 0
+        length = len(chunk)
+        while i < length:
+            if steps >= max_steps:
+                status = 'max_steps'
+                break
+            if state in accept_states:
+                status = 'accepted'
+                break
+
+            loop = loops.get(state)
+            if loop is not None:
+                # Barrido: traducir de una vez el tramo que no cambia de estado
+                table, leave = loop
+                match = leave.search(chunk, i)
+                end = min(match.start() if match else length, i + max_steps - steps)
+                if end > i:
+                    out.append(chunk[i:end].translate(table))
+                    steps += end - i
+                    i = end
+                    continue
+
+            transition = transitions.get((state, chunk[i]))
+            if transition is None:
+                status = 'rejected'
+                break
+            state, write, direction = transition
+            out.append(write)
+            steps += 1
+            i += 1
+            if direction != 'R':
+                # Transición que se queda en la celda y entra a aceptación
+                status = 'max_steps' if steps >= max_steps else 'accepted'
+                break
+
+        out.append(chunk[i:])
+        yield ''.join(out).replace(blank, '')
+
+    # Fin de la entrada: el cabezal lee blancos
+    while status is None:
+        if steps >= max_steps:
+            status = 'max_steps'
+        elif state in accept_states:
+            status = 'accepted'
+        else:
+            transition = transitions.get((state, blank))
+            if transition is None:
+                status = 'rejected'
+                break
+            state, write, _ = transition
+            steps += 1
+            cells += 1
+            if write != blank:
+                yield write
+
+    result['status'] = status
+    result['steps'] = steps
+    metrics.record_run(status, steps, cells, time.perf_counter() - started)
+
+
+def _threaded(generator, maxsize=4):
+    """
+    Ejecuta un generador en su propio hilo, entregando sus valores por una
+    cola acotada, para que las etapas de la tubería avancen en paralelo.
+    """
+    items = queue.Queue(maxsize)
+    done = object()
+
+    def pump():
+        try:
+            for item in generator:
+                items.put(item)
+        except BaseException as e:
+            items.put(e)
+        items.put(done)
+
+    threading.Thread(target=pump, daemon=True).start()
+    while True:
+        item = items.get()
+        if item is done:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+class PipelineStage:
+    """
+    Etapa de una tubería: un programa de MT y un prefijo que se antepone a la
+    salida de la etapa anterior (por ejemplo "3#" para pasar la llave).
+    """
+
+    def __init__(self, program, prefix=''):
+        """
+        Args:
+            program: MachineProgram o ruta a un archivo de configuración
+            prefix: Cadena que se antepone a la entrada de esta etapa
+        """
+        if not isinstance(program, MachineProgram):
+            program = load_program(program)
+        self.program = program
+        self.prefix = prefix
+
+
+class MachinePipeline:
+    """
+    Composición de programas de MT ejecutados uno tras otro.
+    """
+
+    def __init__(self, stages, max_steps=100000):
+        """
+        Args:
+            stages: Lista de PipelineStage (o de programas/rutas sin prefijo)
+            max_steps: Máximo de pasos por etapa
+        """
+        self.stages = [stage if isinstance(stage, PipelineStage) else PipelineStage(stage)
+                       for stage in stages]
+        self.max_steps = max_steps
+        self.results = []
+        self.stage_outputs = []
+
+    @property
+    def streamable(self):
+        """True si todas las etapas pueden ejecutarse en modo flujo."""
+        return all(is_streamable(stage.program) for stage in self.stages)
+
+    def run(self, input_string, trace=False, verbose=False):
+        """
+        Ejecuta la tubería entregando la cinta de cada etapa a la siguiente.
+
+        Args:
+            input_string: Entrada de la primera etapa (sin su prefijo)
+            trace: Si True, guarda la salida de cada etapa en stage_outputs
+            verbose: Si True, imprime la configuración de cada paso de cada etapa
+
+        Returns:
+            Tupla (accepted, output): accepted es True si todas las etapas
+            aceptaron; el resultado de cada etapa queda en results. Una etapa
+            que rechaza igual entrega su cinta a la siguiente, como en stream()
+        """
+        self.results = []
+        self.stage_outputs = []
+        tape = list(self.stages[0].prefix + input_string)
+        machine = None
+
+        for i, stage in enumerate(self.stages):
+            if i:
+                # Compactar la cinta anterior y anteponer el prefijo, en la misma lista
+                blank = machine.blank_symbol
+                w = 0
+                for cell in tape:
+                    if cell != blank:
+                        tape[w] = cell
+                        w += 1
+                del tape[w:]
+                tape[0:0] = stage.prefix
+            machine = self._adopt_tape(stage.program, tape)
+            progress = machine.run_for(self.max_steps, verbose=verbose)
+            self.results.append({'status': progress.status, 'steps': progress.steps})
+            tape = machine.tape
+            if trace:
+                self.stage_outputs.append(machine.get_tape_content())
+
+        accepted = all(result['status'] == 'accepted' for result in self.results)
+        return accepted, machine.get_tape_content()
+
+    def _adopt_tape(self, program, tape):
+        """
+        Crea el contexto de una etapa que usa la lista tape como cinta, sin
+        copiarla (la lista pertenece a la tubería).
+        """
+        machine = program.new_context('list')
+        machine.start('', self.max_steps)
+        machine.tape = tape
+        return machine
+
+    def stream(self, chunks, threaded=False):
+        """
+        Ejecuta la tubería en modo flujo (todas las etapas deben ser transductores
+        que se mueven a la derecha).
+
+        Args:
+            chunks: Iterable de fragmentos de la entrada (sin el prefijo inicial)
+            threaded: Si True, cada etapa corre en su propio hilo
+
+        Yields:
+            Fragmentos de la salida final; al terminar, results tiene el
+            estado de cada etapa
+        """
+        if not self.streamable:
+            raise ValueError("La tubería tiene etapas que no son transductores hacia la derecha")
+
+        self.results = []
+        upstream = iter(chunks)
+        for stage in self.stages:
+            result = {}
+            self.results.append(result)
+            if stage.prefix:
+                upstream = chain([stage.prefix], upstream)
+            upstream = _transduce(stage.program, upstream, self.max_steps, result)
+            if threaded:
+                upstream = _threaded(upstream)
+        return upstream
+
+    def run_streaming(self, input_string, chunk_size=DEFAULT_CHUNK_SIZE, threaded=False):
+        """
+        Conveniencia: ejecuta stream() sobre una cadena dividida en fragmentos.
+
+        Returns:
+            Tupla (accepted, output) como run()
+        """
+        chunks = (input_string[i:i + chunk_size] for i in range(0, len(input_string), chunk_size))
+        output = ''.join(self.stream(chunks, threaded))
+        accepted = all(result.get('status') == 'accepted' for result in self.results)
+        return accepted, output
@@ -0,0 +1,629 @@
+"""
+Cintas alternativas para la Máquina de Turing
+La cinta por defecto es una lista de Python con un carácter por celda.
+MMapTape guarda un byte por celda en un archivo mapeado en memoria y
+RopeTape usa bloques con corridas codificadas por longitud. Ambas ofrecen
+la misma interfaz que usa TuringMachine (len, índice, append,
+insert(0, ...), pop de los extremos, iteración) más content(blank) para
+extraer la salida sin construir la cinta completa.
+"""
+
+import mmap
+import re
+import tempfile
+from itertools import repeat
+
+
+# A partir de esta longitud de entrada la selección automática usa MMapTape
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+# Tamaño de bloque (bytes) y bloques residentes alrededor del cabezal
+MMAP_BLOCK_SIZE = 1024 * 1024
+MMAP_WINDOW_BLOCKS = 4
+
+# Celdas por bloque literal de RopeTape y longitud mínima de una corrida
+ROPE_CHUNK_SIZE = 4096
+ROPE_MIN_RUN = 32
+
+
+def create_tape(input_string, blank_symbol, symbols=(), backend='auto'):
+    """
+    Crea la cinta para una cadena de entrada.
+
+    Args:
+        input_string: Contenido inicial de la cinta
+        blank_symbol: Símbolo blanco
+        symbols: Símbolos que la máquina puede escribir (alfabeto de cinta)
+        backend: 'list', 'mmap', 'rope' o 'auto' (mmap para entradas muy grandes)
+
+    Returns:
+        Lista de símbolos o una cinta con la misma interfaz
+    """
+    if backend == 'auto':
+        backend = 'list'
+        if len(input_string) >= MMAP_THRESHOLD:
+            alphabet = set(symbols) | set(input_string) | {blank_symbol}
+            if len(alphabet) <= 256 and all(len(s) == 1 for s in alphabet):
+                backend = 'mmap'
+
+    if backend == 'list':
+        return list(input_string)
+    if backend == 'mmap':
+        return MMapTape.from_string(input_string, blank_symbol, symbols)
+    if backend == 'rope':
+        return RopeTape.from_string(input_string, blank_symbol)
+    raise ValueError(f"Tipo de cinta desconocido: {backend}")
+
+
+def tape_content(tape, blank_symbol):
+    """
+    Retorna el contenido de una cinta sin símbolos blancos.
+    """
+    if isinstance(tape, list):
+        return ''.join(tape).replace(blank_symbol, '')
+    return tape.content(blank_symbol)
+
+
+class _PagedFile:
+    """
+    Región de bytes respaldada por un archivo temporal con nombre (otros
+    procesos pueden mapearlo). Solo se mapea en memoria una ventana de
+    bloques alrededor de la última posición accedida; el archivo crece por
+    bloques (relleno con ceros).
+    """
+
+    def __init__(self, block_size, window_blocks):
+        if block_size % mmap.ALLOCATIONGRANULARITY:
+            raise ValueError("El tamaño de bloque debe ser múltiplo de mmap.ALLOCATIONGRANULARITY")
+        self.block_size = block_size
+        self.window_blocks = window_blocks
+        self._file = tempfile.NamedTemporaryFile(prefix='tm_tape_')
+        self.path = self._file.name
+        self._size = 0
+        self._map = None
+        self._start = 0
+        self._end = 0
+
+    def _unmap(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._start = self._end = 0
+
+    def _grow(self, offset):
+        if offset >= self._size:
+            blocks = offset // self.block_size + self.window_blocks
+            self._unmap()
+            self._size = blocks * self.block_size
+            self._file.truncate(self._size)
+
+    def _page_in(self, offset):
+        half = self.window_blocks // 2
+        start = max(0, (offset // self.block_size - half) * self.block_size)
+        length = min(self.window_blocks * self.block_size, self._size - start)
+        self._unmap()
+        self._map = mmap.mmap(self._file.fileno(), length, offset=start)
+        self._start = start
+        self._end = start + length
+
+    def get(self, offset):
+        if offset >= self._size:
+            return 0
+        if not self._start <= offset < self._end:
+            self._page_in(offset)
+        return self._map[offset - self._start]
+
+    def set(self, offset, code):
+        self._grow(offset)
+        if not self._start <= offset < self._end:
+            self._page_in(offset)
+        self._map[offset - self._start] = code
+
+    def write(self, offset, data):
+        self._grow(offset + len(data))
+        self._unmap()
+        self._file.seek(offset)
+        self._file.write(data)
+        self._file.flush()
+
+    def flush(self):
+        if self._map is not None:
+            self._map.flush()
+        self._file.flush()
+
+    def read(self, offset, length):
+        if self._map is not None:
+            self._map.flush()
+        self._file.seek(offset)
+        return self._file.read(length).ljust(length, b'\x00')
+
+    def close(self):
+        self._unmap()
+        self._file.close()
+
+
+class MMapTape:
+    """
+    Cinta en un archivo mapeado en memoria con un byte por celda.
+
+    Admite alfabetos de hasta 256 símbolos (el blanco es el código 0, así que
+    las zonas nuevas del archivo ya son blancos). Crece hacia ambos lados: las
+    celdas a la derecha del origen y las de la izquierda se guardan en dos
+    regiones separadas, la izquierda en orden inverso.
+    """
+
+    def __init__(self, blank_symbol='_', symbols=(), block_size=MMAP_BLOCK_SIZE,
+                 window_blocks=MMAP_WINDOW_BLOCKS):
+        """
+        Args:
+            blank_symbol: Símbolo blanco
+            symbols: Alfabeto de la cinta
+            block_size: Bytes por bloque paginado
+            window_blocks: Bloques mapeados alrededor del cabezal
+        """
+        self.blank_symbol = blank_symbol
+        self._symbols = [blank_symbol]
+        self._codes = {blank_symbol: 0}
+        self._encode_table = {ord(blank_symbol): '\x00'}
+        self._decode_table = {0: ord(blank_symbol)}
+        for symbol in sorted(set(symbols) - {blank_symbol}):
+            self._add_symbol(symbol)
+
+        self._right = _PagedFile(block_size, window_blocks)
+        self._left = _PagedFile(block_size, window_blocks)
+        self._right_base = 0      # Offset físico de la primera celda derecha
+        self._right_len = 0
+        self._left_base = 0       # Offset físico de la celda izquierda más lejana
+        self._left_len = 0
+
+    @classmethod
+    def from_string(cls, input_string, blank_symbol='_', symbols=(), **kwargs):
+        """
+        Crea una cinta con el contenido de la cadena, escrita por bloques.
+        """
+        tape = cls(blank_symbol, set(symbols) | set(input_string), **kwargs)
+        step = tape._right.block_size
+        for offset in range(0, len(input_string), step):
+            tape._right.write(offset, tape._encode(input_string[offset:offset + step]))
+        tape._right_len = len(input_string)
+        return tape
+
+    def _add_symbol(self, symbol):
+        if len(self._symbols) >= 256:
+            raise ValueError("MMapTape solo admite alfabetos de hasta 256 símbolos")
+        if len(symbol) != 1:
+            raise ValueError(f"MMapTape solo admite símbolos de un carácter: {symbol!r}")
+        self._codes[symbol] = len(self._symbols)
+        self._symbols.append(symbol)
+        self._encode_table = {ord(s): chr(c) for s, c in self._codes.items()}
+        self._decode_table = {c: ord(s) for c, s in enumerate(self._symbols)}
+
+    def _code(self, symbol):
+        code = self._codes.get(symbol)
+        if code is None:
+            self._add_symbol(symbol)
+            code = self._codes[symbol]
+        return code
+
+    def _encode(self, text):
+        return text.translate(self._encode_table).encode('latin-1')
+
+    def _decode(self, data):
+        return data.decode('latin-1').translate(self._decode_table)
+
+    def _locate(self, index):
+        if index < 0:
+            index += len(self)
+        if index < self._left_len:
+            return self._left, self._left_base + self._left_len - 1 - index
+        return self._right, self._right_base + index - self._left_len
+
+    def __len__(self):
+        return self._left_len + self._right_len
+
+    def __getitem__(self, index):
+        region, offset = self._locate(index)
+        return self._symbols[region.get(offset)]
+
+    def __setitem__(self, index, symbol):
+        region, offset = self._locate(index)
+        region.set(offset, self._code(symbol))
+
+    def append(self, symbol):
+        self._right.set(self._right_base + self._right_len, self._code(symbol))
+        self._right_len += 1
+
+    def insert(self, index, symbol):
+        if index != 0:
+            raise IndexError("MMapTape solo admite insertar al inicio")
+        self._left.set(self._left_base + self._left_len, self._code(symbol))
+        self._left_len += 1
+
+    def pop(self, index=-1):
+        if not len(self):
+            raise IndexError("pop de una cinta vacía")
+        if index not in (0, -1, len(self) - 1):
+            raise IndexError("MMapTape solo admite pop en los extremos")
+        symbol = self[index]
+        self[index] = self.blank_symbol
+        if index == 0:
+            if self._left_len:
+                self._left_len -= 1
+            else:
+                self._right_base += 1
+                self._right_len -= 1
+        elif self._right_len:
+            self._right_len -= 1
+        else:
+            self._left_base += 1
+            self._left_len -= 1
+        return symbol
+
+    def _chunks(self):
+        """Genera el contenido codificado de la cinta, en orden, por bloques."""
+        step = self._right.block_size
+        for end in range(self._left_base + self._left_len, self._left_base, -step):
+            start = max(self._left_base, end - step)
+            yield self._left.read(start, end - start)[::-1]
+        stop = self._right_base + self._right_len
+        for start in range(self._right_base, stop, step):
+            yield self._right.read(start, min(step, stop - start))
+
+    def __iter__(self):
+        for chunk in self._chunks():
+            yield from self._decode(chunk)
+
+    def content(self, blank_symbol=None):
+        """
+        Retorna el contenido de la cinta sin blancos (el blanco es el código 0
+        y se descarta antes de decodificar cada bloque).
+        """
+        return ''.join(self._decode(chunk.replace(b'\x00', b'')) for chunk in self._chunks())
+
+    def read_range(self, start, end):
+        """
+        Retorna las celdas [start, end) como cadena. Las celdas a la derecha
+        del origen se leen del archivo en un solo bloque.
+        """
+        if start >= self._left_len:
+            offset = self._right_base + start - self._left_len
+            return self._decode(self._right.read(offset, end - start))
+        return ''.join(self[index] for index in range(start, end))
+
+    def write_range(self, start, text):
+        """
+        Escribe text en las celdas existentes a partir de start.
+        """
+        if start < self._left_len or start + len(text) > len(self):
+            for index, symbol in enumerate(text, start):
+                self[index] = symbol
+            return
+        for symbol in set(text):
+            self._code(symbol)
+        self._right.write(self._right_base + start - self._left_len, self._encode(text))
+
+    def shared_region(self, start, end):
+        """
+        Archivo y offset físico de las celdas [start, end), para que otros
+        procesos las mapeen directamente (un byte por celda, en orden).
+
+        Returns:
+            Tupla (ruta, offset), o None si alguna celda está a la izquierda
+            del origen (esa región se guarda en orden inverso) o fuera de la cinta
+        """
+        if start < self._left_len or end > len(self):
+            return None
+        self._right.flush()
+        return self._right.path, self._right_base + start - self._left_len
+
+    def code_table(self, table):
+        """
+        Convierte una tabla de str.translate a los códigos de la cinta.
+
+        Returns:
+            Tupla (tabla de bytes.translate, códigos de los símbolos de la tabla)
+        """
+        result = bytearray(range(256))
+        codes = []
+        for source, write in table.items():
+            code = self._codes.get(chr(source))
+            if code is None:
+                # El símbolo no está en la cinta, así que no hace falta traducirlo
+                continue
+            write = write if isinstance(write, str) else chr(write)
+            result[code] = self._code(write)
+            codes.append(code)
+        return bytes(result), bytes(sorted(codes))
+
+    def close(self):
+        """Libera los archivos temporales de la cinta."""
+        self._right.close()
+        self._left.close()
+
+
+class _Run:
+    """
+    Corrida de celdas iguales dentro de una RopeTape.
+    """
+    __slots__ = ('symbol', 'length')
+
+    def __init__(self, symbol, length):
+        self.symbol = symbol
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+
+class RopeTape:
+    """
+    Cinta en bloques: listas literales de hasta ROPE_CHUNK_SIZE celdas y
+    corridas codificadas por longitud (_Run) para tramos uniformes, incluidos
+    los blancos.
+
+    Un cursor recuerda el bloque del último acceso, así que mover el cabezal
+    dentro de un bloque o a uno vecino es O(1). Escribir dentro de una
+    corrida la parte en (corrida, celda, corrida) o pasa la celda al bloque
+    vecino. Los blancos que se agregan en los extremos siempre van a una
+    corrida, las corridas vecinas del mismo símbolo se unen y un tramo
+    uniforme de al menos min_run celdas dentro de un bloque literal vuelve a
+    ser corrida, así que la memoria depende del contenido y no de la
+    longitud de la cinta. La salida salta las corridas de blancos sin
+    recorrerlas.
+    """
+
+    def __init__(self, blank_symbol='_', chunk_size=ROPE_CHUNK_SIZE, min_run=ROPE_MIN_RUN):
+        """
+        Args:
+            blank_symbol: Símbolo blanco
+            chunk_size: Máximo de celdas por bloque literal
+            min_run: Longitud mínima de un tramo uniforme para guardarlo como corrida
+        """
+        self.blank_symbol = blank_symbol
+        self.chunk_size = chunk_size
+        self.min_run = min_run
+        self._blocks = []
+        self._length = 0
+        self._block = 0           # Índice del bloque del cursor
+        self._start = 0           # Posición lógica donde empieza ese bloque
+
+    @classmethod
+    def from_string(cls, input_string, blank_symbol='_', chunk_size=ROPE_CHUNK_SIZE,
+                    min_run=ROPE_MIN_RUN):
+        """
+        Crea la cinta detectando corridas de al menos min_run símbolos iguales.
+        """
+        tape = cls(blank_symbol, chunk_size, min_run)
+        blocks = tape._blocks
+        runs = re.compile(r'(.)\1{%d,}' % (min_run - 1), re.DOTALL)
+        position = 0
+        for match in runs.finditer(input_string):
+            tape._add_literal(input_string[position:match.start()])
+            blocks.append(_Run(match.group(1), match.end() - match.start()))
+            position = match.end()
+        tape._add_literal(input_string[position:])
+        tape._length = len(input_string)
+        return tape
+
+    def _add_literal(self, text):
+        for i in range(0, len(text), self.chunk_size):
+            self._blocks.append(list(text[i:i + self.chunk_size]))
+
+    def _find(self, index):
+        """Mueve el cursor al bloque que contiene la posición."""
+        blocks = self._blocks
+        b, start = self._block, self._start
+        while index < start:
+            b -= 1
+            start -= len(blocks[b])
+        while index >= start + len(blocks[b]):
+            start += len(blocks[b])
+            b += 1
+        self._block, self._start = b, start
+        return b, start
+
+    def _index(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("índice fuera de la cinta")
+        return index
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        index = self._index(index)
+        b, start = self._find(index)
+        block = self._blocks[b]
+        if isinstance(block, list):
+            return block[index - start]
+        return block.symbol
+
+    def __setitem__(self, index, symbol):
+        index = self._index(index)
+        b, start = self._find(index)
+        blocks = self._blocks
+        block = blocks[b]
+        if isinstance(block, list):
+            offset = index - start
+            if block[offset] != symbol:
+                block[offset] = symbol
+                self._compact(b, start, offset)
+            return
+        if block.symbol == symbol:
+            return
+
+        offset = index - start
+        previous = blocks[b - 1] if b > 0 else None
+        following = blocks[b + 1] if b + 1 < len(blocks) else None
+
+        if offset == 0 and isinstance(previous, _Run) and previous.symbol == symbol:
+            # La celda alarga la corrida anterior
+            previous.length += 1
+            block.length -= 1
+            self._block, self._start = b - 1, start - previous.length + 1
+            if not block.length:
+                del blocks[b]
+                self._merge_runs(b - 1)
+        elif offset == 0 and isinstance(previous, list) and len(previous) < self.chunk_size:
+            # La celda pasa al final del bloque literal anterior
+            previous.append(symbol)
+            block.length -= 1
+            if not block.length:
+                del blocks[b]
+            self._block, self._start = b - 1, start - len(previous) + 1
+            self._compact(b - 1, self._start, len(previous) - 1)
+        elif offset == block.length - 1 and isinstance(following, _Run) \
+                and following.symbol == symbol:
+            # La celda alarga la corrida siguiente
+            following.length += 1
+            block.length -= 1
+            if block.length:
+                self._block, self._start = b + 1, index
+            else:
+                del blocks[b]
+                self._block, self._start = b, index
+                self._merge_runs(b)
+        elif offset == block.length - 1 and isinstance(following, list) \
+                and len(following) < self.chunk_size:
+            # La celda pasa al inicio del bloque literal siguiente
+            following.insert(0, symbol)
+            block.length -= 1
+            if block.length:
+                b += 1
+            else:
+                del blocks[b]
+            self._block, self._start = b, index
+            self._compact(b, index, 0)
+        else:
+            parts = []
+            if offset:
+                parts.append(_Run(block.symbol, offset))
+            parts.append([symbol])
+            if block.length - offset - 1:
+                parts.append(_Run(block.symbol, block.length - offset - 1))
+            blocks[b:b + 1] = parts
+            self._block, self._start = b + (1 if offset else 0), index
+
+    def _compact(self, b, start, offset):
+        """
+        Si la celda offset del bloque literal b (que empieza en start) quedó
+        en un tramo uniforme de al menos min_run celdas, lo convierte en una
+        corrida unida a las corridas vecinas del mismo símbolo.
+        """
+        blocks = self._blocks
+        block = blocks[b]
+        symbol = block[offset]
+        left = offset
+        while left and block[left - 1] == symbol:
+            left -= 1
+        right = offset + 1
+        while right < len(block) and block[right] == symbol:
+            right += 1
+        if right - left < self.min_run:
+            return
+
+        parts = [block[:left]] if left else []
+        parts.append(_Run(symbol, right - left))
+        if right < len(block):
+            parts.append(block[right:])
+        blocks[b:b + 1] = parts
+        self._block, self._start = b + (1 if left else 0), start + left
+        self._merge_runs(self._block)
+
+    def _merge_runs(self, b):
+        """
+        Une la corrida b (donde está el cursor) con las corridas vecinas del
+        mismo símbolo.
+        """
+        blocks = self._blocks
+        run = blocks[b]
+        following = blocks[b + 1] if b + 1 < len(blocks) else None
+        if isinstance(following, _Run) and following.symbol == run.symbol:
+            run.length += following.length
+            del blocks[b + 1]
+        previous = blocks[b - 1] if b > 0 else None
+        if isinstance(previous, _Run) and previous.symbol == run.symbol:
+            self._block, self._start = b - 1, self._start - previous.length
+            previous.length += run.length
+            del blocks[b]
+
+    def append(self, symbol):
+        blocks = self._blocks
+        last = blocks[-1] if blocks else None
+        self._length += 1
+        if isinstance(last, _Run) and last.symbol == symbol:
+            last.length += 1
+        elif isinstance(last, list) and len(last) < self.chunk_size \
+                and symbol != self.blank_symbol:
+            last.append(symbol)
+            self._compact(len(blocks) - 1, self._length - len(last), len(last) - 1)
+        else:
+            # Los blancos nuevos siempre empiezan una corrida
+            blocks.append(_Run(symbol, 1))
+
+    def insert(self, index, symbol):
+        if index != 0:
+            raise IndexError("RopeTape solo admite insertar al inicio")
+        blocks = self._blocks
+        first = blocks[0] if blocks else None
+        if isinstance(first, _Run) and first.symbol == symbol:
+            first.length += 1
+        elif isinstance(first, list) and len(first) < self.chunk_size \
+                and symbol != self.blank_symbol:
+            first.insert(0, symbol)
+        else:
+            blocks.insert(0, _Run(symbol, 1))
+            if len(blocks) > 1:
+                self._block += 1
+        if self._block:
+            self._start += 1
+        self._length += 1
+
+    def pop(self, index=-1):
+        if not self._length:
+            raise IndexError("pop de una cinta vacía")
+        if index not in (0, -1, self._length - 1):
+            raise IndexError("RopeTape solo admite pop en los extremos")
+        b = 0 if index == 0 else -1
+        block = self._blocks[b]
+        if isinstance(block, list):
+            symbol = block.pop(b)
+            empty = not block
+        else:
+            symbol = block.symbol
+            block.length -= 1
+            empty = not block.length
+        if empty:
+            del self._blocks[b]
+        self._length -= 1
+        self._block = self._start = 0
+        return symbol
+
+    def __iter__(self):
+        for block in self._blocks:
+            if isinstance(block, list):
+                yield from block
+            else:
+                yield from repeat(block.symbol, block.length)
+
+    def content(self, blank_symbol=None):
+        """
+        Retorna el contenido sin blancos; las corridas de blancos se saltan
+        sin recorrerlas.
+        """
+        blank = self.blank_symbol if blank_symbol is None else blank_symbol
+        parts = []
+        for block in self._blocks:
+            if isinstance(block, list):
+                parts.append(''.join(block).replace(blank, ''))
+            elif block.symbol != blank:
+                parts.append(block.symbol * block.length)
+        return ''.join(parts)
+
+    def memory_cells(self):
+        """
+        Celdas almacenadas explícitamente (las corridas cuentan como una).
+        """
+        return sum(len(block) if isinstance(block, list) else 1 for block in self._blocks)
@@ -4,9 +4,113 @@ Implementación básica que respeta las operaciones tradicionales:
 - Cambiar de estado
 - Sustituir símbolo en la cinta
 - Moverse a la izquierda o derecha
+
+El programa de la máquina (estados, alfabetos, transiciones) es un
+MachineProgram inmutable que se puede compartir entre hilos o tareas; cada
+TuringMachine es un contexto de ejecución con su propia cinta, cabezal y estado.
 """
 
+import asyncio
 import json
+import os
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+from src import metrics
+from src.tape import MMAP_THRESHOLD, create_tape, tape_content
+
+
+@dataclass(frozen=True, eq=False)
+class MachineProgram:
+    """
+    Programa inmutable de una Máquina de Turing (Q, Σ, Γ, q0, F, δ).
+    """
+    states: frozenset
+    input_alphabet: frozenset
+    tape_alphabet: frozenset
+    initial_state: str
+    accept_states: frozenset
+    blank_symbol: str
+    transitions: MappingProxyType
+    
+    @classmethod
+    def from_config(cls, config):
+        """
+        Construye el programa a partir de una configuración ya leída del JSON.
+        
+        Args:
+            config: Diccionario con el formato de los archivos de config/
+        """
+        # Formato: {(estado, símbolo_leído): (nuevo_estado, símbolo_escribir, dirección)}
+        transitions = {}
+        for transition in config['transitions']:
+            key = (transition['current_state'], transition['read_symbol'])
+            value = (
+                transition['next_state'],
+                transition['write_symbol'],
+                transition['direction']
+            )
+            transitions[key] = value
+        
+        return cls(
+            states=frozenset(config['states']),
+            input_alphabet=frozenset(config['input_alphabet']),
+            tape_alphabet=frozenset(config['tape_alphabet']),
+            initial_state=config['initial_state'],
+            accept_states=frozenset(config['accept_states']),
+            blank_symbol=config.get('blank_symbol', '_'),
+            transitions=MappingProxyType(transitions),
+        )
+    
+    def new_context(self, tape_backend='auto'):
+        """
+        Crea un contexto de ejecución (TuringMachine) que comparte este programa.
+        """
+        return TuringMachine.from_program(self, tape_backend)
+
+
+def load_program(config_file):
+    """
+    Carga un MachineProgram desde un archivo JSON.
+    El resultado se reutiliza mientras el archivo no cambie.
+    
+    Args:
+        config_file: Ruta al archivo de configuración
+    """
+    path = os.path.abspath(config_file)
+    return _load_program(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_program(path, mtime_ns):
+    start = time.perf_counter()
+    with open(path, 'r', encoding='utf-8') as f:
+        program = MachineProgram.from_config(json.load(f))
+    metrics.registry.observe('tm_config_load_seconds', time.perf_counter() - start)
+    return program
+
+
+@dataclass(frozen=True)
+class RunProgress:
+    """
+    Progreso de una ejecución por tramos.
+    
+    status es None mientras la ejecución sigue, o uno de 'accepted',
+    'rejected', 'max_steps', 'timeout' o 'cancelled' cuando terminó.
+    """
+    steps: int
+    state: str
+    status: str = None
+    
+    @property
+    def done(self):
+        return self.status is not None
+    
+    @property
+    def accepted(self):
+        return self.status == 'accepted'
 
 
 class TuringMachine:
@@ -14,12 +118,16 @@ class TuringMachine:
     Clase base para simular una Máquina de Turing.
     """
     
-    def __init__(self, config_file=None):
+    def __init__(self, config_file=None, tape_backend='auto'):
         """
         Inicializa la máquina de Turing.
         
         Args:
             config_file: Archivo JSON con la configuración de la MT
+            tape_backend: Representación de la cinta: 'list', 'mmap'
+                          (archivo mapeado, un byte por celda), 'rope'
+                          (bloques con corridas de blancos comprimidas) o
+                          'auto' (mmap solo para entradas muy grandes)
         """
         self.states = set()           # Q: Conjunto de estados
         self.input_alphabet = set()   # Σ: Alfabeto de entrada
@@ -32,10 +140,44 @@ class TuringMachine:
         self.head_position = 0        # Posición del cabezal
         self.current_state = None     # Estado actual
         self.blank_symbol = '_'       # Símbolo blanco
+        self.steps = 0                # Pasos ejecutados en la última corrida
+        self.tape_backend = tape_backend
+        self.program = None           # MachineProgram compartido (si existe)
+        self.max_steps = 100000       # Límite de la ejecución en curso
+        self.deadline = None          # Tiempo límite (time.monotonic)
+        self.status = None            # Motivo de término de la ejecución
+        self.started = None           # Inicio de la ejecución (time.perf_counter)
         
         if config_file:
             self.load_config(config_file)
     
+    @classmethod
+    def from_program(cls, program, tape_backend='auto'):
+        """
+        Crea un contexto de ejecución para un programa ya cargado, sin copiarlo.
+        
+        Args:
+            program: MachineProgram compartido
+            tape_backend: Representación de la cinta
+        """
+        machine = cls(tape_backend=tape_backend)
+        machine.use_program(program)
+        return machine
+    
+    def use_program(self, program):
+        """
+        Asocia esta máquina a un MachineProgram (los atributos del programa
+        apuntan a los objetos inmutables compartidos).
+        """
+        self.program = program
+        self.states = program.states
+        self.input_alphabet = program.input_alphabet
+        self.tape_alphabet = program.tape_alphabet
+        self.initial_state = program.initial_state
+        self.accept_states = program.accept_states
+        self.blank_symbol = program.blank_symbol
+        self.transitions = program.transitions
+    
     def load_config(self, config_file):
         """
         Carga la configuración de la MT desde un archivo JSON.
@@ -43,27 +185,7 @@ class TuringMachine:
         Args:
             config_file: Ruta al archivo de configuración
         """
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
-        self.states = set(config['states'])
-        self.input_alphabet = set(config['input_alphabet'])
-        self.tape_alphabet = set(config['tape_alphabet'])
-        self.initial_state = config['initial_state']
-        self.accept_states = set(config['accept_states'])
-        self.blank_symbol = config.get('blank_symbol', '_')
-        
-        # Cargar transiciones
-        # Formato: {(estado, símbolo_leído): (nuevo_estado, símbolo_escribir, dirección)}
-        self.transitions = {}
-        for transition in config['transitions']:
-            key = (transition['current_state'], transition['read_symbol'])
-            value = (
-                transition['next_state'],
-                transition['write_symbol'],
-                transition['direction']
-            )
-            self.transitions[key] = value
+        self.use_program(load_program(config_file))
     
     def initialize_tape(self, input_string):
         """
@@ -72,10 +194,25 @@ class TuringMachine:
         Args:
             input_string: Cadena a colocar en la cinta
         """
-        self.tape = list(input_string)
+        if hasattr(self.tape, 'close'):
+            self.tape.close()
+        
+        if self.tape_backend == 'list' or (
+                self.tape_backend == 'auto' and len(input_string) < MMAP_THRESHOLD):
+            self.tape = list(input_string)
+        else:
+            self.tape = create_tape(input_string, self.blank_symbol,
+                                    self._tape_symbols(), self.tape_backend)
         self.head_position = 0
         self.current_state = self.initial_state
     
+    def _tape_symbols(self):
+        """
+        Símbolos que pueden aparecer en la cinta (alfabeto y escrituras).
+        """
+        written = {value[1] for value in self.transitions.values()}
+        return self.tape_alphabet | written | {self.blank_symbol}
+    
     def read_symbol(self):
         """
         Lee el símbolo en la posición actual del cabezal.
@@ -151,31 +288,128 @@ class TuringMachine:
             
         Returns:
             Tupla (accepted, output) donde accepted indica si se aceptó
-            y output es el contenido de la cinta
+            y output es el contenido de la cinta. El número de pasos
+            ejecutados queda en self.steps.
+        """
+        self.start(input_string, max_steps)
+        progress = self.run_for(max_steps, verbose=verbose)
+        return progress.accepted, self.get_tape_content()
+    
+    def start(self, input_string, max_steps=100000, timeout=None):
+        """
+        Prepara una ejecución reanudable con run_for().
+        
+        Args:
+            input_string: Cadena de entrada
+            max_steps: Número máximo de pasos de toda la ejecución
+            timeout: Segundos de reloj permitidos (None = sin límite)
         """
         self.initialize_tape(input_string)
-        steps = 0
+        self.steps = 0
+        self.max_steps = max_steps
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.status = None
+        self.started = time.perf_counter()
+    
+    def run_for(self, steps=1000, cancel=None, verbose=False):
+        """
+        Ejecuta a lo sumo `steps` pasos de la ejecución iniciada con start()
+        y devuelve el control con el progreso. El tiempo límite y la
+        cancelación se revisan al inicio de cada tramo.
         
-        while steps < max_steps:
+        Args:
+            steps: Pasos de este tramo
+            cancel: Objeto con is_set() (por ejemplo threading.Event)
+            verbose: Si True, imprime información de depuración
+            
+        Returns:
+            RunProgress con los pasos acumulados y el estado de la ejecución
+        """
+        if self.status is not None:
+            return self.progress()
+        if cancel is not None and cancel.is_set():
+            self.status = 'cancelled'
+        elif self.deadline is not None and time.monotonic() >= self.deadline:
+            self.status = 'timeout'
+        if self.status is not None:
+            self._record_run()
+            return self.progress()
+        
+        max_steps = self.max_steps
+        limit = min(self.steps + steps, max_steps)
+        n = self.steps
+        
+        while True:
+            if n >= max_steps:
+                # Se alcanzó el máximo de pasos
+                self.status = 'max_steps'
+                break
+            if n >= limit:
+                break
+            
             if verbose:
                 self.print_configuration()
             
             # Verificar si estamos en un estado de aceptación
             if self.current_state in self.accept_states:
-                output = ''.join(self.tape).replace(self.blank_symbol, '')
-                return True, output
+                self.status = 'accepted'
+                break
             
             # Ejecutar un paso
             if not self.step():
                 # No hay transición disponible
-                output = ''.join(self.tape).replace(self.blank_symbol, '')
-                return False, output
+                self.status = 'rejected'
+                break
             
-            steps += 1
+            n += 1
+        
+        self.steps = n
+        if self.status is not None:
+            self._record_run()
+        return self.progress()
+    
+    def _record_run(self):
+        """
+        Registra en las métricas una ejecución que acaba de terminar.
+        """
+        seconds = time.perf_counter() - self.started if self.started is not None else 0.0
+        metrics.record_run(self.status, self.steps, len(self.tape), seconds)
+    
+    def progress(self):
+        """
+        Retorna el progreso de la ejecución actual.
+        """
+        return RunProgress(self.steps, self.current_state, self.status)
+    
+    def run_iter(self, input_string, slice_steps=1000, max_steps=100000,
+                 timeout=None, cancel=None):
+        """
+        Generador que ejecuta la máquina por tramos de slice_steps pasos.
         
-        # Se alcanzó el máximo de pasos
-        output = ''.join(self.tape).replace(self.blank_symbol, '')
-        return False, output
+        Yields:
+            RunProgress después de cada tramo; el último tiene done=True y la
+            salida se obtiene con get_tape_content()
+        """
+        self.start(input_string, max_steps, timeout)
+        while True:
+            progress = self.run_for(slice_steps, cancel)
+            yield progress
+            if progress.done:
+                return
+    
+    async def run_async(self, input_string, slice_steps=1000, max_steps=100000,
+                        timeout=None, cancel=None):
+        """
+        Versión asyncio de run(): cede el control al bucle de eventos después
+        de cada tramo para que varias ejecuciones largas se intercalen.
+        
+        Returns:
+            Tupla (accepted, output); el motivo de término queda en self.status
+        """
+        for progress in self.run_iter(input_string, slice_steps, max_steps, timeout, cancel):
+            if not progress.done:
+                await asyncio.sleep(0)
+        return progress.accepted, self.get_tape_content()
     
     def print_configuration(self):
         """
@@ -195,4 +429,4 @@ class TuringMachine:
         Returns:
             Contenido de la cinta como string
         """
-        return ''.join(self.tape).replace(self.blank_symbol, '')
+        return tape_content(self.tape, self.blank_symbol)
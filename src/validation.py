@@ -0,0 +1,135 @@
+"""
+Validación Previa de Entradas
+Rechaza entradas imposibles antes de simular la máquina, con reglas derivadas
+automáticamente de la configuración cargada:
+
+1. Símbolos fuera del alfabeto de entrada Σ (una sola búsqueda con expresión
+   regular sobre toda la cadena). Por definición la entrada es una cadena
+   sobre Σ, aunque la máquina pudiera tolerar algún símbolo del alfabeto de
+   cinta.
+2. Aproximación por autómata finito: mientras la máquina solo se mueve a la
+   derecha, cada celda de la entrada se lee una única vez y en orden, así que
+   las transiciones con movimiento 'R' forman un AFD exacto. Los tramos en
+   que un estado se repite sobre sí mismo (por ejemplo q_enc_k recorriendo el
+   mensaje) se saltan con una expresión regular en lugar de paso a paso.
+
+La segunda regla solo rechaza lo que la máquina también rechazaría; si la
+máquina deja de moverse a la derecha, la validación se detiene y la entrada se
+da por buena.
+"""
+
+import re
+from functools import lru_cache
+
+
+class InputValidationError(ValueError):
+    """
+    Entrada que la máquina rechazaría, con la posición del símbolo culpable.
+    """
+
+    def __init__(self, position, symbol, reason):
+        super().__init__(f"posición {position} ({symbol!r}): {reason}")
+        self.position = position
+        self.symbol = symbol
+        self.reason = reason
+
+
+def _char_class(symbols, negate=True):
+    body = ''.join(re.escape(s) for s in sorted(symbols))
+    if not body:
+        return re.compile(r'[\s\S]' if negate else r'(?!)')
+    return re.compile(f"[{'^' if negate else ''}{body}]")
+
+
+class InputValidator:
+    """
+    Validador derivado de un programa de Máquina de Turing.
+    """
+
+    def __init__(self, program):
+        """
+        Args:
+            program: MachineProgram o TuringMachine con la configuración cargada
+        """
+        self.initial_state = program.initial_state
+        self.accept_states = program.accept_states
+        self.blank_symbol = program.blank_symbol
+        self.state_count = len(program.states) or 1
+
+        if all(len(s) == 1 for s in program.input_alphabet):
+            self._invalid = _char_class(program.input_alphabet)
+        else:
+            self._invalid = None
+
+        # AFD con las transiciones de la máquina: estado -> {símbolo: (siguiente, dirección)}
+        self._edges = {}
+        loops = {}
+        for (state, symbol), (next_state, _, direction) in program.transitions.items():
+            self._edges.setdefault(state, {})[symbol] = (next_state, direction)
+            if direction == 'R' and next_state == state and len(symbol) == 1 \
+                    and symbol != self.blank_symbol:
+                loops.setdefault(state, set()).add(symbol)
+
+        # Para cada estado con lazos: búsqueda del primer símbolo que sale del lazo
+        self._leave_loop = {state: _char_class(symbols) for state, symbols in loops.items()}
+
+    def check(self, input_string):
+        """
+        Revisa una entrada sin ejecutar la máquina.
+
+        Returns:
+            None si la entrada puede ser aceptada, o una tupla
+            (posición, símbolo, motivo) si la máquina la rechazaría
+        """
+        if self._invalid is not None:
+            match = self._invalid.search(input_string)
+            if match:
+                return match.start(), match.group(), "símbolo fuera del alfabeto de entrada"
+
+        state = self.initial_state
+        position = 0
+        length = len(input_string)
+        blank_steps = 0
+
+        while state not in self.accept_states:
+            edges = self._edges.get(state, {})
+
+            leave = self._leave_loop.get(state)
+            if leave is not None and position < length:
+                match = leave.search(input_string, position)
+                position = match.start() if match else length
+
+            symbol = input_string[position] if position < length else self.blank_symbol
+            edge = edges.get(symbol)
+            if edge is None:
+                return position, symbol, f"sin transición desde {state}"
+
+            next_state, direction = edge
+            if direction != 'R':
+                # Desde aquí el AFD ya no es exacto (salvo que se acepte)
+                return None
+
+            if position >= length:
+                blank_steps += 1
+                if blank_steps > self.state_count:
+                    return position, symbol, "la máquina no se detiene después de la entrada"
+            state = next_state
+            position += 1
+
+        return None
+
+    def validate(self, input_string):
+        """
+        Igual que check(), pero lanza InputValidationError si la entrada es inválida.
+        """
+        problem = self.check(input_string)
+        if problem is not None:
+            raise InputValidationError(*problem)
+
+
+@lru_cache(maxsize=32)
+def validator_for(program):
+    """
+    Retorna el validador de un MachineProgram (se construye una sola vez).
+    """
+    return InputValidator(program)
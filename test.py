@@ -6,6 +6,16 @@ Verifica que el simulador funciona correctamente con todos los ejemplos del PDF
 
 from src.caesar_encrypt import create_encrypt_machine
 from src.caesar_decrypt import create_decrypt_machine
+from src.turing_machine import MachineProgram, TuringMachine, load_program
+from src import differential
+from src.tape import MMapTape, RopeTape
+from src.complexity import analyze_config
+from src.debugger import TuringDebugger
+from src.validation import InputValidationError, validator_for
+from src.pipeline import MachinePipeline, PipelineStage
+from src.parallel import ParallelTuringMachine
+from src import metrics
+from src.config_generator import BYTES, LATIN1, build_program
 
 
 def test_example_1():
@@ -127,6 +137,649 @@ def test_round_trip():
         return False
 
 
+def test_brute_force():
+    """Criptoanálisis: recuperar la llave de un mensaje sin conocerla"""
+    print("Test 6: Fuerza bruta con ranking por frecuencias")
+    encrypt_machine = create_encrypt_machine()
+    decrypt_machine = create_decrypt_machine()
+    
+    original = "ROMA NO FUE CONSTRUIDA EN UN DIA Y LA PACIENCIA ES LA MADRE DE LA CIENCIA"
+    encrypted = encrypt_machine.encrypt(f"7#{original}")
+    
+    candidates = decrypt_machine.brute_force(encrypted, top_k=3)
+    key, text, score, _ = candidates[0]
+    
+    with_dictionary = decrypt_machine.brute_force(
+        encrypted, top_k=1, dictionary={"ROMA", "DIA", "LA", "ES"})
+    
+    print(f"  Cifrado:     {encrypted}")
+    print(f"  Mejor llave: {key} (chi² = {score:.2f})")
+    print(f"  Decriptado:  {text}")
+    
+    if key == 7 and text == original and with_dictionary[0][0] == 7 \
+            and len(candidates) == 3:
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_differential():
+    """Arnés diferencial: referencia JSON vs motores y auxiliares"""
+    print("Test 7: Pruebas diferenciales (referencia vs auxiliares)")
+    config_file = differential.MODES['encrypt']
+    cases = differential.generate_cases(config_file, count=100, seed=7)
+    failures = differential.run_differential(config_file, cases, max_steps=500, processes=1)
+    
+    # Un motor defectuoso (ignora la letra Q) debe detectarse y reducirse
+    class BrokenEngine(TuringMachine):
+        def run(self, input_string, max_steps=100000, verbose=False):
+            return super().run(input_string.replace('Q', ''), max_steps, verbose)
+    
+    differential.register_engine('defectuoso', BrokenEngine)
+    try:
+        broken = differential.run_differential(config_file, ["3#AQUI NO HAY NADA"], processes=1)
+    finally:
+        del differential.ENGINES['defectuoso']
+    
+    print(f"  Casos generados: {len(cases)}")
+    print(f"  Diferencias:     {len(failures)}")
+    print(f"  Motor defectuoso reducido a: {broken[0][1] if broken else None!r}")
+    
+    if not failures and len(broken) == 1 and broken[0][1] == 'Q':
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_mmap_tape():
+    """Cinta en archivo mapeado: equivalente a la lista de Python"""
+    print("Test 8: Cinta paginada en archivo mapeado (mmap)")
+    import mmap
+    import random
+    
+    rng = random.Random(3)
+    block = mmap.ALLOCATIONGRANULARITY
+    tape = MMapTape.from_string("3#HOLA", '_', "ABCDEFGHIJKLMNOPQRSTUVWXYZ#_",
+                                block_size=block, window_blocks=2)
+    model = list("3#HOLA")
+    
+    # Crecer hacia ambos lados más allá de varias ventanas y escribir al azar
+    for i in range(3 * block):
+        tape.append('X' if i % 7 else '_')
+        model.append('X' if i % 7 else '_')
+        tape.insert(0, 'Y')
+        model.insert(0, 'Y')
+    for _ in range(2000):
+        index = rng.randrange(len(model))
+        symbol = rng.choice('ABC_')
+        tape[index] = symbol
+        model[index] = symbol
+    popped = (tape.pop(0), tape.pop(), model.pop(0), model.pop())
+    
+    same_tape = len(tape) == len(model) and ''.join(tape) == ''.join(model) \
+        and tape.content() == ''.join(model).replace('_', '')
+    tape.close()
+    
+    machine = TuringMachine("config/encrypt_config.json", tape_backend='mmap')
+    accepted, encrypted = machine.run("3#ROMA NO FUE CONSTRUIDA EN UN DIA")
+    
+    print(f"  Celdas comparadas: {len(model)}")
+    print(f"  Encriptado con mmap: {encrypted}")
+    
+    if same_tape and popped[:2] == popped[2:] and accepted \
+            and encrypted == "URPD QR IXH FRQVWUXLGD HQ XQ GLD":
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_complexity():
+    """Análisis de complejidad: César lineal, ida y vuelta cuadrática"""
+    print("Test 9: Análisis de complejidad de pasos")
+    import json
+    import os
+    import tempfile
+    
+    linear = analyze_config("config/encrypt_config.json", lengths=[8, 16, 32, 64], samples=5)
+    
+    # MT que marca cada 'a' y recorre la cinta hasta el final y de regreso
+    def t(q, r, n, w, d):
+        return {"current_state": q, "read_symbol": r, "next_state": n,
+                "write_symbol": w, "direction": d}
+    config = {
+        "states": ["q0", "q_right", "q_left", "q_accept"],
+        "input_alphabet": ["a"],
+        "tape_alphabet": ["a", "X", "_"],
+        "initial_state": "q0",
+        "accept_states": ["q_accept"],
+        "blank_symbol": "_",
+        "transitions": [
+            t("q0", "a", "q_right", "X", "R"), t("q0", "_", "q_accept", "_", "S"),
+            t("q_right", "a", "q_right", "a", "R"), t("q_right", "_", "q_left", "_", "L"),
+            t("q_left", "a", "q_left", "a", "L"), t("q_left", "X", "q0", "X", "R"),
+        ],
+    }
+    fd, path = tempfile.mkstemp(suffix=".json")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+        quadratic = analyze_config(path, lengths=[8, 16, 32, 64], samples=2)
+    finally:
+        os.remove(path)
+    
+    print(f"  Encriptación: {linear.model}, max_steps sugerido (n=1000): {linear.suggest_max_steps(1000)}")
+    print(f"  Ida y vuelta: {quadratic.model}, espacio máximo: {quadratic.max_space}")
+    
+    if linear.model == 'O(n)' and quadratic.model == 'O(n²)' \
+            and linear.suggest_max_steps(1000) >= 1001:
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_debugger():
+    """Depurador: puntos de interrupción, retroceso y saltos con deltas"""
+    print("Test 10: Depurador con viaje en el tiempo")
+    machine = TuringMachine("config/encrypt_config.json")
+    debugger = TuringDebugger(machine, checkpoint_interval=8)
+    debugger.load("13#HOLA MUNDO")
+    
+    debugger.add_breakpoint(state="q_enc_13")
+    stop = debugger.continue_()
+    at_key = (stop, debugger.step_count, machine.current_state)
+    
+    # Recorrer hasta el final guardando cada configuración
+    snapshots = [(list(machine.tape), machine.head_position, machine.current_state)]
+    while debugger.step_forward():
+        snapshots.append((list(machine.tape), machine.head_position, machine.current_state))
+    final_step = debugger.step_count
+    
+    # Retroceder paso a paso debe reproducir las mismas configuraciones
+    rewound = True
+    for expected in reversed(snapshots[:-1]):
+        debugger.step_back()
+        rewound &= (list(machine.tape), machine.head_position, machine.current_state) == expected
+    
+    # Saltos hacia adelante y hacia atrás (usando puntos de control)
+    debugger.jump_to(final_step)
+    jumped = (list(machine.tape), machine.head_position, machine.current_state) == snapshots[-1]
+    debugger.jump_to(at_key[1] + 1)
+    jumped &= (list(machine.tape), machine.head_position, machine.current_state) == snapshots[1]
+    
+    # Crecimiento de la cinta hacia la izquierda también se deshace
+    machine.transitions = {('q0', 'a'): ('q1', 'b', 'L'), ('q1', '_'): ('q2', 'c', 'L'),
+                           ('q2', '_'): ('q_accept', 'd', 'R')}
+    debugger.load("a")
+    debugger.continue_()
+    grown = ''.join(machine.tape)
+    debugger.jump_to(0)
+    left = grown == "dcb" and machine.tape == ['a'] and machine.head_position == 0
+    
+    # Con cinta rope no hay puntos de control: se retrocede con los deltas sobre la misma cinta
+    rope_machine = TuringMachine("config/encrypt_config.json", tape_backend='rope')
+    rope_debugger = TuringDebugger(rope_machine, checkpoint_interval=2)
+    rope_debugger.load("3#HOLA")
+    rope_tape = rope_machine.tape
+    rope_debugger.continue_()
+    rope_debugger.jump_to(1)
+    rope = not rope_debugger.checkpoints and rope_machine.tape is rope_tape \
+        and list(rope_machine.tape) == list("_#HOLA") and rope_machine.head_position == 1
+    
+    print(f"  Punto de interrupción: {at_key}")
+    print(f"  Pasos totales: {final_step}, deltas registrados: {len(debugger.log)}")
+    
+    if at_key == ('breakpoint', 3, 'q_enc_13') and rewound and jumped and left and rope:
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_shared_program():
+    """Programa inmutable compartido por varios contextos concurrentes"""
+    print("Test 11: Programa compartido entre hilos")
+    from concurrent.futures import ThreadPoolExecutor
+    
+    program = load_program("config/encrypt_config.json")
+    same = program is load_program("config/encrypt_config.json")
+    
+    inputs = [f"{k}#ROMA NO FUE CONSTRUIDA EN UN DIA" for k in range(26)] * 8
+    expected = [create_encrypt_machine().encrypt(text) for text in inputs]
+    
+    def work(text):
+        return program.new_context().run(text)[1]
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(work, inputs))
+    
+    frozen = False
+    try:
+        program.transitions[('q0', '3')] = ('q_accept', '_', 'S')
+    except TypeError:
+        try:
+            program.initial_state = 'q_accept'
+        except AttributeError:
+            frozen = True
+    
+    print(f"  Ejecuciones concurrentes: {len(inputs)}")
+    print(f"  Programa reutilizado: {same}, inmutable: {frozen}")
+    
+    if same and frozen and results == expected:
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_time_sliced():
+    """Ejecución por tramos con límite de tiempo y cancelación"""
+    print("Test 12: Ejecución cooperativa por tramos")
+    import asyncio
+    import threading
+    
+    program = load_program("config/encrypt_config.json")
+    long_input = "3#" + "ROMA NO FUE CONSTRUIDA EN UN DIA " * 100
+    
+    machine = program.new_context()
+    slices = list(machine.run_iter(long_input, slice_steps=500))
+    sliced_ok = slices[-1].accepted and all(not p.done for p in slices[:-1]) \
+        and [p.steps for p in slices[:-1]] == [500 * (i + 1) for i in range(len(slices) - 1)] \
+        and machine.get_tape_content() == program.new_context().run(long_input)[1]
+    
+    timed = program.new_context()
+    timed.start(long_input, timeout=0)
+    timeout_status = timed.run_for(100).status
+    
+    cancel = threading.Event()
+    cancelled = program.new_context()
+    cancelled.start(long_input)
+    cancelled.run_for(100, cancel)
+    cancel.set()
+    cancel_progress = cancelled.run_for(100, cancel)
+    
+    # Una ejecución corta no espera a que termine una larga
+    finished = []
+    
+    async def job(name, text):
+        result = await program.new_context().run_async(text, slice_steps=200)
+        finished.append(name)
+        return result
+    
+    async def both():
+        return await asyncio.gather(job("larga", long_input), job("corta", "3#HOLA"))
+    
+    results = asyncio.run(both())
+    
+    print(f"  Tramos: {len(slices)}, pasos totales: {slices[-1].steps}")
+    print(f"  Tiempo agotado: {timeout_status}, cancelada: {cancel_progress.status} "
+          f"tras {cancel_progress.steps} pasos")
+    print(f"  Orden de término: {finished}")
+    
+    if sliced_ok and timeout_status == 'timeout' and cancel_progress.status == 'cancelled' \
+            and cancel_progress.steps == 100 and finished == ["corta", "larga"] \
+            and results[1] == (True, "KROD"):
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_input_validation():
+    """Validación previa derivada de la tabla de transiciones"""
+    print("Test 13: Validación previa de entradas")
+    program = load_program("config/encrypt_config.json")
+    validator = validator_for(program)
+    
+    checks = {
+        "13#ROMA NO FUE CONSTRUIDA EN UN DIA": None,
+        "3#HO-LA": 4,          # símbolo fuera del alfabeto
+        "3HOLA": 5,            # falta el separador '#'
+        "27#HOLA": 1,          # llave fuera de rango
+    }
+    positions = {text: (validator.check(text) or (None,))[0] for text in checks}
+    
+    try:
+        validator.validate("3HOLA")
+        raised = False
+    except InputValidationError as e:
+        raised = e.position == 5
+    
+    # Una entrada enorme se valida sin simular paso a paso
+    huge = "3#" + "ROMA NO FUE CONSTRUIDA EN UN DIA " * 60000 + "!"
+    huge_position = validator.check(huge)[0]
+    
+    # El autómata nunca rechaza algo que la máquina acepta (el alfabeto es
+    # una regla aparte: la MT tolera el blanco '_' dentro del mensaje)
+    cases = differential.generate_cases(differential.MODES['encrypt'], count=300, seed=11)
+    sound = True
+    for text in cases:
+        problem = validator.check(text)
+        if problem and problem[2] != "símbolo fuera del alfabeto de entrada":
+            sound &= not program.new_context().run(text)[0]
+    
+    print(f"  Posiciones: {list(positions.values())}")
+    print(f"  Entrada de {len(huge)} símbolos rechazada en la posición {huge_position}")
+    
+    if positions == checks and raised and huge_position == len(huge) - 1 and sound:
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_rope_tape():
+    """Cinta en bloques con corridas: equivalente a la lista, memoria según contenido"""
+    print("Test 14: Cinta en bloques con corridas (rope)")
+    import random
+    
+    rng = random.Random(5)
+    start = "3#" + "_" * 500 + "HOLA" + "X" * 100
+    tape = RopeTape.from_string(start, '_', chunk_size=16)
+    model = list(start)
+    for _ in range(5000):
+        operation = rng.random()
+        symbol = rng.choice('_ABX')
+        if operation < 0.1:
+            tape.append(symbol)
+            model.append(symbol)
+        elif operation < 0.2:
+            tape.insert(0, symbol)
+            model.insert(0, symbol)
+        else:
+            index = rng.randrange(len(model))
+            tape[index] = symbol
+            model[index] = symbol
+    same = list(tape) == model and tape.content() == ''.join(model).replace('_', '')
+    
+    # Cinta dispersa: un millón de blancos con unos pocos símbolos escritos
+    sparse = RopeTape('_')
+    for _ in range(1000000):
+        sparse.append('_')
+    for index in (10, 500000, 999999):
+        sparse[index] = 'A'
+    
+    # Una máquina que recorre 100 000 celdas escribiendo una marca cada 100
+    states = [f"q{i}" for i in range(100)]
+    transitions = [{'current_state': 'q0', 'read_symbol': symbol, 'next_state': 'q0',
+                    'write_symbol': symbol, 'direction': 'R'} for symbol in "HOLA"]
+    transitions += [{'current_state': state, 'read_symbol': '_',
+                     'next_state': states[(i + 1) % 100],
+                     'write_symbol': 'M' if i == 0 else '_', 'direction': 'R'}
+                    for i, state in enumerate(states)]
+    marker = MachineProgram.from_config({
+        'states': states, 'input_alphabet': list("HOLA"), 'tape_alphabet': list("HOLAM_"),
+        'initial_state': 'q0', 'accept_states': [], 'blank_symbol': '_',
+        'transitions': transitions})
+    marked = marker.new_context('rope')
+    marked.start("HOLA", max_steps=100004)
+    marked.run_for(100004)
+    
+    machine = TuringMachine("config/encrypt_config.json", tape_backend='rope')
+    accepted, encrypted = machine.run("3#ROMA NO FUE CONSTRUIDA EN UN DIA")
+    
+    print(f"  Celdas comparadas: {len(model)}")
+    print(f"  Cinta dispersa: {len(sparse)} celdas, {sparse.memory_cells()} almacenadas")
+    print(f"  Marcas cada 100 celdas: {len(marked.tape)} celdas, "
+          f"{marked.tape.memory_cells()} almacenadas")
+    print(f"  Encriptado con rope: {encrypted}")
+    
+    if same and sparse.content() == "AAA" and sparse.memory_cells() < 10 \
+            and marked.get_tape_content() == "HOLA" + "M" * 1000 \
+            and marked.tape.memory_cells() < 2100 \
+            and accepted and encrypted == "URPD QR IXH FRQVWUXLGD HQ XQ GLD":
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_pipeline():
+    """Tubería encriptar → decriptar: cinta compartida y flujo por fragmentos"""
+    print("Test 15: Tubería de máquinas (encriptar → decriptar)")
+    
+    message = "EL VENI VIDI VICI DE CESAR"
+    pipeline = MachinePipeline([
+        PipelineStage("config/encrypt_config.json"),
+        PipelineStage("config/decrypt_config.json", prefix="7#"),
+    ])
+    accepted, decrypted = pipeline.run("7#" + message, trace=True)
+    encrypted = pipeline.stage_outputs[0]
+    
+    # Modo flujo con fragmentos diminutos, en línea y con un hilo por etapa
+    streamed = pipeline.run_streaming("7#" + message, chunk_size=3)
+    threaded = pipeline.run_streaming("7#" + message, chunk_size=5, threaded=True)
+    steps = [result['steps'] for result in pipeline.results]
+    
+    # Una etapa que rechaza entrega su cinta igual en ambos modos
+    rejected = pipeline.run("7#HOLA#MUNDO") == pipeline.run_streaming("7#HOLA#MUNDO", chunk_size=2)
+    
+    # La cinta compartida es interna: run() con una lista no la modifica
+    cells = list("7#HOLA")
+    TuringMachine("config/encrypt_config.json").run(cells)
+    copied = cells == list("7#HOLA")
+    
+    print(f"  Encriptado: {encrypted}")
+    print(f"  Decriptado: {decrypted}")
+    print(f"  Pasos por etapa (flujo): {steps}")
+    
+    if accepted and decrypted == message and encrypted == "LS CLUP CPKP CPJP KL JLZHY" \
+            and pipeline.streamable \
+            and streamed == threaded == (True, message) \
+            and steps == [len(message) + 3] * 2 and rejected and copied:
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_parallel_sweep():
+    """Barrido del mensaje por tramos y en procesos: mismos pasos y salida"""
+    print("Test 16: Barrido paralelo sobre una misma entrada")
+    
+    message = "ALEA IACTA EST " * 2000
+    reference = TuringMachine("config/encrypt_config.json", tape_backend='list')
+    expected = reference.run("7#" + message, max_steps=10 ** 6)
+    expected_steps = reference.steps
+    
+    results = []
+    for backend in ('list', 'mmap'):
+        machine = ParallelTuringMachine("config/encrypt_config.json", tape_backend=backend,
+                                        workers=3, parallel_threshold=1000)
+        results.append((machine.run("7#" + message, max_steps=10 ** 6), machine.steps))
+    
+    # Un símbolo fuera del lazo en un segmento intermedio: los trabajadores
+    # se detienen ahí y la máquina rechaza en el mismo paso
+    broken = "7#" + message[:17000] + "a" + message[17000:]
+    rejected = reference.run(broken, max_steps=10 ** 6), reference.steps
+    machine = ParallelTuringMachine("config/encrypt_config.json", tape_backend='mmap',
+                                    workers=3, parallel_threshold=1000)
+    same_rejection = (machine.run(broken, max_steps=10 ** 6), machine.steps) == rejected
+    machine.close()
+    
+    # max_steps a mitad del barrido: se detiene exactamente en el mismo paso
+    reference.run("7#" + message, max_steps=12345)
+    machine = ParallelTuringMachine("config/encrypt_config.json", workers=3, parallel_threshold=1000)
+    cut = machine.run("7#" + message, max_steps=12345)
+    
+    # Cancelación y tiempo límite se revisan antes de barrer, como en TuringMachine
+    import threading
+    cancel = threading.Event()
+    stopped = []
+    for engine in (TuringMachine, ParallelTuringMachine):
+        sliced = engine("config/encrypt_config.json")
+        sliced.start("3#" + "A" * 10000)
+        sliced.run_for(10)
+        cancel.set()
+        cancelled = sliced.run_for(5000, cancel)
+        cancel.clear()
+        sliced.start("3#" + "A" * 10000, timeout=0)
+        stopped.append((cancelled, sliced.run_for(5000)))
+    
+    print(f"  Pasos: referencia {expected_steps}, por backend {[steps for _, steps in results]}")
+    print(f"  Cancelada: {stopped[1][0].steps} pasos, tiempo agotado: {stopped[1][1].steps} pasos")
+    print(f"  Corte en max_steps: {machine.steps} pasos ({machine.status})")
+    
+    if all(result == expected and steps == expected_steps for result, steps in results) \
+            and cut == (False, reference.get_tape_content()) \
+            and machine.steps == reference.steps == 12345 and machine.status == 'max_steps' \
+            and same_rejection and rejected[1] == 17002 \
+            and stopped[0] == stopped[1] and stopped[1][0].steps == 10 \
+            and stopped[1][0].status == 'cancelled' and stopped[1][1].status == 'timeout':
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_metrics():
+    """Métricas por hilo: resultados, pasos, exportación Prometheus y JSON"""
+    print("Test 17: Métricas de ejecución")
+    import json
+    import os
+    import tempfile
+    import threading
+    
+    metrics.registry.reset()
+    program = load_program("config/encrypt_config.json")
+    
+    def worker(inputs):
+        machine = program.new_context()
+        for text in inputs:
+            machine.run(text, max_steps=50)
+    
+    # 4 hilos: 3 aceptadas, 1 rechazada y 1 sin pasos suficientes cada uno
+    inputs = ["3#HOLA", "1#MUNDO", "5#A", "3#A#B", "3#" + "A" * 100]
+    threads = [threading.Thread(target=worker, args=(inputs,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    create_encrypt_machine().encrypt("3#HOLA")
+    
+    counters, histograms = metrics.registry.collect()
+    outcomes = {dict(labels)['outcome']: value for (name, labels), value in counters.items()
+                if name == 'tm_runs_total'}
+    steps = histograms[('tm_run_steps', ())]
+    text = metrics.registry.prometheus()
+    
+    path = os.path.join(tempfile.mkdtemp(), 'metricas.json')
+    metrics.SnapshotWriter(path, interval=60).start().stop()
+    with open(path, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    
+    # Las tuberías en modo flujo registran una ejecución por etapa
+    metrics.registry.reset()
+    MachinePipeline([PipelineStage("config/encrypt_config.json"),
+                     PipelineStage("config/decrypt_config.json", prefix="3#")]) \
+        .run_streaming("3#HOLA", chunk_size=2)
+    streamed, streamed_histograms = metrics.registry.collect()
+    streamed_runs = streamed.get(('tm_runs_total', (('outcome', 'accepted'),)))
+    streamed_steps = streamed_histograms[('tm_run_steps', ())][-2]
+    
+    # Los fragmentos de los hilos que terminan se combinan: no crecen con cada hilo
+    metrics.registry.reset()
+    for _ in range(200):
+        thread = threading.Thread(target=metrics.registry.inc, args=('tm_runs_total',),
+                                  kwargs={'outcome': 'accepted'})
+        thread.start()
+        thread.join()
+    retired = metrics.registry.collect()[0].get(('tm_runs_total', (('outcome', 'accepted'),)))
+    shards = len(metrics.registry._shards)
+    
+    print(f"  Resultados: {outcomes}")
+    print(f"  Pasos: {steps[-1]} ejecuciones, {steps[-2]} pasos en total")
+    print(f"  Tubería en flujo: {streamed_runs} ejecuciones, {streamed_steps} pasos")
+    print(f"  200 hilos terminados: {retired} ejecuciones, {shards} fragmentos vivos")
+    
+    if outcomes == {'accepted': 12, 'rejected': 4, 'max_steps': 4} \
+            and steps[-1] == 20 and steps[-2] == 4 * (7 + 8 + 4 + 3 + 50) \
+            and 'tm_runs_total{outcome="accepted"} 12' in text \
+            and 'tm_run_steps_bucket{le="+Inf"} 20' in text \
+            and 'caesar_helper_seconds_count{operation="encrypt"} 1' in text \
+            and len(snapshot['counters']) == 3 \
+            and streamed_runs == 2 and streamed_steps == 7 + 7 \
+            and retired == 200 and shards <= 2:
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
+def test_config_generator():
+    """Configuraciones generadas: equivalentes a las de config/, otros alfabetos y llaves"""
+    print("Test 18: Generador de configuraciones César")
+    
+    # Con los parámetros por defecto se comporta como las configuraciones escritas a mano
+    same = True
+    for mode in ('encrypt', 'decrypt'):
+        reference = TuringMachine(f"config/{mode}_config.json")
+        generated = build_program(mode).new_context()
+        for text in ["3#ROMA NO FUE CONSTRUIDA EN UN DIA", "D#HOLA.", "25#Z", "3#HOLA#", "26#A"]:
+            same = same and reference.run(text) == generated.run(text) \
+                and reference.steps == generated.steps
+    
+    # Latin-1 con llaves de tres dígitos, encadenado en una tubería
+    message = "¿Qué tal, señor Müller? 100% ¡bien!"
+    pipeline = MachinePipeline([
+        PipelineStage(build_program('encrypt', LATIN1, range(1000))),
+        PipelineStage(build_program('decrypt', LATIN1, range(1000)), prefix="777#"),
+    ])
+    latin1 = pipeline.run("777#" + message, trace=True)
+    key_steps = pipeline.results[0]['steps']
+    
+    # Texto UTF-8 como bytes (el blanco pasa a ser '\u2423' porque '_' es un byte)
+    text = "Atención 北京 😀 _#"
+    data = text.encode('utf-8').decode('latin-1')
+    encrypt = build_program('encrypt', BYTES, range(256)).new_context()
+    decrypt = build_program('decrypt', BYTES, range(256)).new_context()
+    _, cipher = encrypt.run("200#" + data)
+    accepted, plain = decrypt.run("200#" + cipher)
+    
+    cached = build_program('encrypt', LATIN1, range(1000)) is build_program('encrypt', LATIN1, list(range(1000)))
+    
+    # Llaves de letra fuera de A-Z: D sigue siendo 3 y 'é' no es una llave
+    latin1_letter = build_program('encrypt', LATIN1, range(100)).new_context()
+    letter_key = latin1_letter.run("D#ABC") == latin1_letter.run("3#ABC") == (True, "DEF") \
+        and not encrypt.run("\xe9#ABC")[0]
+    
+    # Un conjunto de llaves restringido también limita las llaves de letra
+    restricted = build_program('encrypt', keys=[5])
+    only_five = restricted.new_context()
+    letter_key = letter_key and only_five.run("F#ABC") == only_five.run("5#ABC") == (True, "FGH") \
+        and not only_five.run("C#ABC")[0] and not only_five.run("3#ABC")[0] \
+        and sorted(symbol for state, symbol in restricted.transitions if state == 'q0') == ['5', 'F'] \
+        and 'C' not in build_program('encrypt', "0123456789", keys=[5]).input_alphabet
+    
+    print(f"  Igual a config/: {same}")
+    print(f"  Latin-1 (llave 777): {pipeline.stage_outputs[0]!r} → {latin1[1]!r}")
+    print(f"  UTF-8: {plain.encode('latin-1').decode('utf-8')!r} (blanco {encrypt.blank_symbol!r})")
+    
+    if same and latin1 == (True, message) and key_steps == len(message) + 5 \
+            and accepted and plain.encode('latin-1').decode('utf-8') == text \
+            and encrypt.blank_symbol == '\u2423' and cached and letter_key:
+        print("  ✓ PASÓ\n")
+        return True
+    else:
+        print("  ✗ FALLÓ\n")
+        return False
+
+
 def main():
     """Ejecuta todas las pruebas"""
     print("=" * 70)
@@ -139,7 +792,20 @@ def main():
         test_example_2,
         test_example_3,
         test_example_4,
-        test_round_trip
+        test_round_trip,
+        test_brute_force,
+        test_differential,
+        test_mmap_tape,
+        test_complexity,
+        test_debugger,
+        test_shared_program,
+        test_time_sliced,
+        test_input_validation,
+        test_rope_tape,
+        test_pipeline,
+        test_parallel_sweep,
+        test_metrics,
+        test_config_generator
     ]
     
     passed = 0